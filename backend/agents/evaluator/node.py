@@ -113,7 +113,7 @@ async def evaluator_node(
     # Build findings text
     findings_text = "\n\n".join(findings) if findings else "No findings collected."
 
-    logger.info(f"Evaluator processing findings (first 2000 chars): {findings_text[:2000]}...")
+    logger.info("Evaluator processing findings (first 2000 chars): %.2000s...", findings_text)
 
     # Evaluate
     llm = get_llm(temperature=0.0, run_id=state["run_id"])
@@ -25,34 +25,23 @@ async def entry_node(state: ResearchState) -> dict:
     plan = state.get("plan", [])
     current_idx = state.get("current_step_index", 0)
 
-    # Check if we have more steps to process
-    todo_steps = [s for s in plan if s["status"] == "TODO"]
-    in_progress_steps = [s for s in plan if s["status"] == "IN_PROGRESS"]
-
-    if not todo_steps and not in_progress_steps:
-        logger.info("No more TODO/IN_PROGRESS steps")
-        return {
-            "phase": "reporting",
-        }
-
-    # Get current step - check for IN_PROGRESS first (recovery/retry scenario)
+    # Single pass: an IN_PROGRESS step wins (recovery/retry scenario),
+    # otherwise fall back to the first TODO step
     current_step = None
+    first_todo = None
     for i, step in enumerate(plan):
-        if step["status"] == "IN_PROGRESS":
-            current_step = step
-            current_idx = i
+        step_status = step["status"]
+        if step_status == "IN_PROGRESS":
+            current_step, current_idx = step, i
             break
+        if step_status == "TODO" and first_todo is None:
+            first_todo = (i, step)
 
-    # If no IN_PROGRESS step, find first TODO
-    if not current_step:
-        for i, step in enumerate(plan):
-            if step["status"] == "TODO":
-                current_step = step
-                current_idx = i
-                break
+    if current_step is None and first_todo is not None:
+        current_idx, current_step = first_todo
 
-    if not current_step:
-        logger.info("No TODO/IN_PROGRESS steps found")
+    if current_step is None:
+        logger.info("No more TODO/IN_PROGRESS steps")
         return {
             "phase": "reporting",
         }
@@ -95,22 +95,26 @@ GUIDELINES:
 - Always choose the most appropriate tool for the next step"""
 
 
+def _format_tool_call(call: dict) -> str:
+    """Format a single tool history entry, reading each field once."""
+    status = "SUCCESS" if call.get("success") else "FAILED"
+    error = call.get("error")
+    error_text = f" - Error: {error}" if error else ""
+    result = call.get("result") or ""
+    result_preview = result[:200] + "..." if len(result) > 200 else result
+    return (
+        f"- [{call.get('id', '?')}] {call.get('tool', 'unknown')}: {status}{error_text}\n"
+        f"  Params: {call.get('params', {})}\n"
+        f"  Result: {result_preview}"
+    )
+
+
 def _format_tool_history(history: list[dict]) -> str:
     """Format tool history for the prompt."""
     if not history:
         return "(none)"
 
-    lines = []
-    for call in history:
-        status = "SUCCESS" if call.get("success") else "FAILED"
-        error = f" - Error: {call.get('error')}" if call.get("error") else ""
-        result_preview = ""
-        if call.get("result"):
-            result_preview = call["result"][:200] + "..." if len(call["result"]) > 200 else call["result"]
-        lines.append(
-            f"- [{call.get('id', '?')}] {call.get('tool', 'unknown')}: {status}{error}\n  Params: {call.get('params', {})}\n  Result: {result_preview}"
-        )
-    return "\n".join(lines)
+    return "\n".join(map(_format_tool_call, history))
 
 
 def _format_accumulated_results(history: list[dict]) -> str:
@@ -118,15 +122,16 @@ def _format_accumulated_results(history: list[dict]) -> str:
     if not history:
         return "(none yet)"
 
-    successful = [h for h in history if h.get("success") and h.get("result")]
-    if not successful:
-        return "(no successful results yet)"
-
+    # Filter and format in a single pass over the history
     lines = []
-    for call in successful:
-        result = call.get("result", "")
+    for call in history:
+        result = call.get("result")
+        if not (call.get("success") and result):
+            continue
         preview = result[:500] + "..." if len(result) > 500 else result
         lines.append(f"[{call.get('tool', 'unknown')}]: {preview}")
+    if not lines:
+        return "(no successful results yet)"
     return "\n\n".join(lines)
 
 
@@ -30,8 +30,8 @@ async def search_dispatcher_node(state: ResearchState) -> dict:
     themes = params.get("themes", [])
 
     # Handle case where single query is provided instead of list
-    if not themes and params.get("query"):
-        themes = [params.get("query")]
+    if not themes and (query := params.get("query")):
+        themes = [query]
 
     # Fall back to existing search_themes from state (set by theme_identifier or strategist)
     if not themes:
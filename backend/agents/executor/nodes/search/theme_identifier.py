@@ -6,6 +6,7 @@ Generates search queries based on the task description or uses themes from decis
 """
 
 import logging
+import re
 
 from langchain_core.messages import SystemMessage
 
@@ -14,6 +15,10 @@ from backend.core.llm import get_llm
 
 logger = logging.getLogger(__name__)
 
+# "SEARCH: <query>" lines (any case) with a non-empty query. [^\S\n] is any
+# whitespace except a line break, matching what str.strip() removes per line.
+_SEARCH_LINE_RE = re.compile(r"^[^\S\n]*SEARCH:[^\S\n]*(\S.*)$", re.IGNORECASE | re.MULTILINE)
+
 THEME_IDENTIFICATION_PROMPT = """You are a research assistant identifying search themes.
 
 Given a research task, identify 1-3 specific search queries that would help complete this task.
@@ -34,15 +39,12 @@ IMPORTANT: Output ONLY the search queries in the format above. No other text."""
 
 
 def parse_search_themes(content: str) -> list[str]:
-    """Parse search queries from LLM response."""
-    themes = []
-    for line in content.strip().split("\n"):
-        line = line.strip()
-        if line.upper().startswith("SEARCH:"):
-            query = line[7:].strip()
-            if query:
-                themes.append(query)
-    return themes
+    """Parse search queries from LLM response, dropping repeated queries."""
+    # dict keeps first-seen order, so one pass both collects and dedups;
+    # a repeated query would otherwise be searched twice in parallel
+    return list(
+        dict.fromkeys(match.group(1).strip() for match in _SEARCH_LINE_RE.finditer(content))
+    )
 
 
 async def theme_identifier_node(state: ResearchState) -> dict:
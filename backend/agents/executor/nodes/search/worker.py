@@ -6,12 +6,20 @@ Each worker instance handles one search query.
 """
 
 import logging
+import re
+from itertools import islice
 from typing import Any
 
 from backend.agents.state import SearchResult
 
 logger = logging.getLogger(__name__)
 
+_URL_RE = re.compile(r"https?://[^\s\)]+")
+_MAX_SOURCES = 5
+
+# Message intelligent_web_search returns when the query found nothing
+_NO_RESULTS_PREFIX = "No relevant information"
+
 
 async def search_worker_node(state: dict[str, Any]) -> dict:
     """
@@ -40,14 +48,16 @@ async def search_worker_node(state: dict[str, Any]) -> dict:
         findings = []
         sources = []
 
-        if result and "No relevant information" not in result:
+        # The no-results message is the whole result, so a prefix check
+        # avoids scanning the full report text
+        if result and not result.startswith(_NO_RESULTS_PREFIX):
             # Extract content - the search tool returns formatted markdown
             findings.append(result)
 
-            # Extract URLs from result (rough parsing)
-            import re
-            urls = re.findall(r'https?://[^\s\)]+', result)
-            sources.extend(urls[:5])  # Limit sources
+            # Extract URLs from result (rough parsing), stopping at the source limit
+            sources.extend(
+                m.group() for m in islice(_URL_RE.finditer(result), _MAX_SOURCES)
+            )
 
         search_result = SearchResult(
             query=query,
@@ -6,6 +6,7 @@ Supports path:start-end syntax for line range specification.
 
 import logging
 import re
+from itertools import islice
 from pathlib import Path
 
 from backend.agents.state import ExecutorToolCall, ResearchState
@@ -13,6 +14,9 @@ from backend.core.config import config
 
 logger = logging.getLogger(__name__)
 
+# Matches path:start-end or path:line
+_LINE_RANGE_RE = re.compile(r"^(.+?):(\d+)(?:-(\d+))?$")
+
 
 def _parse_file_path(path_spec: str) -> tuple[str, int | None, int | None]:
     """
@@ -25,8 +29,11 @@ def _parse_file_path(path_spec: str) -> tuple[str, int | None, int | None]:
 
     Returns: (path, start_line, end_line)
     """
-    # Match pattern: path:start-end or path:line
-    match = re.match(r"^(.+?):(\d+)(?:-(\d+))?$", path_spec)
+    # Plain paths carry no line range, skip the regex entirely
+    if ":" not in path_spec:
+        return path_spec, None, None
+
+    match = _LINE_RANGE_RE.match(path_spec)
 
     if match:
         path = match.group(1)
@@ -83,26 +90,23 @@ async def file_reader_node(state: ResearchState) -> dict:
         if not resolved_path.is_file():
             raise ValueError(f"Not a file: {path}")
 
-        # Read file content
-        content = resolved_path.read_text(encoding="utf-8", errors="replace")
-        lines = content.split("\n")
-        total_lines = len(lines)
+        max_chars = config.research.max_file_read_chars
 
-        # Apply line range if specified
-        if start_line is not None:
-            start_idx = max(0, start_line - 1)  # Convert to 0-indexed
-            end_idx = min(total_lines, end_line) if end_line else total_lines
-            lines = lines[start_idx:end_idx]
-            content = "\n".join(lines)
+        # Stream the file: only the requested lines (or the first max_chars
+        # characters) are ever held in memory
+        with resolved_path.open(encoding="utf-8", errors="replace") as f:
+            if start_line is not None:
+                start_idx = max(0, start_line - 1)  # Convert to 0-indexed
+                lines = (line.rstrip("\n") for line in islice(f, start_idx, end_line or None))
 
-            # Add line numbers for context
-            numbered_lines = []
-            for i, line in enumerate(lines, start=start_idx + 1):
-                numbered_lines.append(f"{i:4d} | {line}")
-            content = "\n".join(numbered_lines)
+                # Add line numbers for context
+                content = "\n".join(
+                    f"{i:4d} | {line}" for i, line in enumerate(lines, start=start_idx + 1)
+                )
+            else:
+                content = f.read(max_chars + 1)
 
         # Enforce character limit
-        max_chars = config.research.max_file_read_chars
         if len(content) > max_chars:
             content = content[:max_chars]
             content += f"\n\n... (truncated, showing first {max_chars} chars of file)"
@@ -24,7 +24,7 @@ async def knowledge_node(state: ResearchState) -> dict:
 
     answer = params.get("answer", "")
 
-    logger.info(f"Knowledge node for run {run_id}: {answer[:100]}...")
+    logger.info("Knowledge node for run %s: %.100s...", run_id, answer)
 
     # Format the answer
     formatted_answer = f"Knowledge-based answer: {answer}"
@@ -35,7 +35,7 @@ async def terminal_execute_node(state: ResearchState) -> dict:
             "phase": "executing",
         }
 
-    logger.info(f"Executing terminal command for run {run_id}: {command[:50]}...")
+    logger.info("Executing terminal command for run %s: %.50s...", run_id, command)
 
     # Create tool call record
     tool_call = ExecutorToolCall(
@@ -36,7 +36,7 @@ async def terminal_prepare_node(state: ResearchState) -> dict:
     # Generate hash for approval tracking
     command_hash = get_command_hash(command)
 
-    logger.info(f"Terminal prepare: {command[:50]}...")
+    logger.info("Terminal prepare: %.50s...", command)
 
     return {
         "pending_terminal": {
@@ -24,7 +24,7 @@ def route_decision(state: ResearchState) -> str:
     decision = state.get("executor_decision", {})
     choice = decision.get("decision", "web_search") if decision else "web_search"
 
-    logger.debug(f"Routing decision: {choice}")
+    logger.debug("Routing decision: %s", choice)
 
     # Map decision to node names (these match the subgraph.py conditional edge keys)
     tool_map = {
@@ -54,7 +54,7 @@ def route_sufficiency_check(state: ResearchState) -> Literal["decision", "exit"]
         logger.info(f"[Iteration {call_count}] Sufficiency check: SUFFICIENT, exiting loop")
         return "exit"
 
-    logger.debug(f"[Iteration {call_count}] Sufficiency check: CONTINUE ({call_count}/{max_calls} calls)")
+    logger.debug("[Iteration %d] Sufficiency check: CONTINUE (%d/%d calls)", call_count, call_count, max_calls)
     return "decision"
 
 
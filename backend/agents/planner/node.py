@@ -44,6 +44,11 @@ Output a numbered list of research steps, one per line:
 Be specific and actionable. Each step should answer a distinct aspect of the user's query."""
 
 
+# Numbered ("1. ", "1) ", "1: ") or bulleted ("- ", "* ") step lines. [^\S\n]
+# is any whitespace except a line break, matching what str.strip() removes.
+_PLAN_STEP_RE = re.compile(r"^[^\S\n]*(?:\d+[\.\)\:]|[\-\*])[^\S\n]*(\S.*)$", re.MULTILINE)
+
+
 def parse_plan_steps(content: str) -> list[str]:
     """
     Parse numbered steps from LLM response.
@@ -53,26 +58,7 @@ def parse_plan_steps(content: str) -> list[str]:
     - "1) Step one"
     - "- Step one"
     """
-    lines = content.strip().split("\n")
-    steps = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Match numbered formats: "1. ", "1) ", "1: "
-        match = re.match(r"^\d+[\.\)\:]\s*(.+)$", line)
-        if match:
-            steps.append(match.group(1).strip())
-            continue
-
-        # Match bullet formats: "- ", "* "
-        match = re.match(r"^[\-\*]\s*(.+)$", line)
-        if match:
-            steps.append(match.group(1).strip())
-
-    return steps
+    return [match.group(1).strip() for match in _PLAN_STEP_RE.finditer(content)]
 
 
 async def planner_node(
@@ -99,7 +85,7 @@ async def planner_node(
 
     if user_feedback and previous_plan:
         # Re-planning based on user feedback
-        logger.info(f"Re-planning with user feedback: {user_feedback[:100]}...")
+        logger.info("Re-planning with user feedback: %.100s...", user_feedback)
         previous_plan_text = "\n".join(
             f"{i+1}. {step['description']}" for i, step in enumerate(previous_plan)
         )
@@ -124,7 +110,7 @@ Please create an improved research plan that addresses the user's feedback."""),
 
     # Invoke LLM
     response = await llm.ainvoke(messages)
-    logger.debug(f"Planner response: {response.content[:200]}...")
+    logger.debug("Planner response: %.200s...", response.content)
 
     # Parse steps from response
     step_descriptions = parse_plan_steps(response.content)
@@ -6,9 +6,11 @@ Explicitly handles knowledge gaps from failed steps.
 """
 
 import logging
+import time
 from typing import Literal
 
-from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+from langchain_openai import ChatOpenAI
 from langgraph.types import Command
 
 from backend.agents.state import ResearchState
@@ -16,6 +18,9 @@ from backend.core.llm import get_creative_llm
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between streamed report chunks pushed to clients
+_STREAM_FLUSH_INTERVAL = 0.1
+
 REPORTER_PROMPT = """You are the Reporter for a deep research system.
 
 Your job is to create a COMPREHENSIVE and DETAILED research report based on the completed research.
@@ -83,25 +88,27 @@ def format_knowledge_gaps(failed_steps: list[dict]) -> str:
     if not failed_steps:
         return "None - all research steps completed successfully."
 
-    gaps = []
+    # Collect lines for all gaps and join once instead of growing per-step strings
+    lines = []
     for step in failed_steps:
-        gap_text = f"### {step['description']}\n"
+        if lines:
+            lines.append("")  # Blank line between gaps
+        lines.append(f"### {step['description']}")
 
         substeps = step.get("substeps", [])
         if substeps:
-            gap_text += "**Attempts made:**\n"
+            lines.append("**Attempts made:**")
             for substep in substeps:
                 queries = substep.get("search_queries", [])
                 queries_str = ", ".join(queries) if queries else "N/A"
                 error = substep.get("error", "Unknown error")[:150]
-                gap_text += f"- Attempt {substep['id'] + 1}: queries=[{queries_str}]\n"
-                gap_text += f"  Result: {error}\n"
+                lines.append(f"- Attempt {substep['id'] + 1}: queries=[{queries_str}]")
+                lines.append(f"  Result: {error}")
         else:
-            gap_text += f"**Error:** {step.get('error', 'No details available')}\n"
-
-        gaps.append(gap_text)
+            lines.append(f"**Error:** {step.get('error', 'No details available')}")
 
-    return "\n".join(gaps)
+    lines.append("")  # Keep the trailing newline of the last gap
+    return "\n".join(lines)
 
 
 def format_partial_findings(failed_steps: list[dict]) -> str:
@@ -122,6 +129,44 @@ def format_partial_findings(failed_steps: list[dict]) -> str:
     return "\n".join(partial) if partial else "None"
 
 
+async def _stream_report(run_id: str, llm: ChatOpenAI, messages: list[BaseMessage]) -> str:
+    """
+    Generate the report while streaming it to connected clients.
+
+    Chunks are coalesced and flushed at most every _STREAM_FLUSH_INTERVAL
+    seconds, so clients see the report as it is written instead of after
+    the whole (long) generation finishes.
+
+    Returns:
+        The complete report text
+    """
+    # Import here to avoid circular imports
+    from backend.services.notification_service import get_notification_service
+
+    notification = get_notification_service()
+    parts = []
+    pending = []
+    last_flush = time.monotonic()
+
+    async for chunk in llm.astream(messages):
+        text = chunk.content
+        if not isinstance(text, str) or not text:
+            continue
+        parts.append(text)
+        pending.append(text)
+
+        now = time.monotonic()
+        if now - last_flush >= _STREAM_FLUSH_INTERVAL:
+            await notification.notify_message_delta(run_id, "".join(pending), name="Reporter")
+            pending.clear()
+            last_flush = now
+
+    if pending:
+        await notification.notify_message_delta(run_id, "".join(pending), name="Reporter")
+
+    return "".join(parts)
+
+
 async def reporter_node(
     state: ResearchState,
 ) -> Command[Literal["__end__"]]:
@@ -158,8 +203,8 @@ async def reporter_node(
         elif step["status"] == "FAILED":
             failed_steps.append(step)
 
-    # Check if this is a total failure case
-    all_failed = all(s["status"] == "FAILED" for s in plan)
+    # Check if this is a total failure case (reuses the categorization pass)
+    all_failed = len(failed_steps) == len(plan)
 
     if all_failed:
         logger.warning(f"Research completely failed: all {len(plan)} steps failed")
@@ -215,8 +260,7 @@ async def reporter_node(
             ),
         ]
 
-        response = await llm.ainvoke(messages)
-        report = response.content
+        report = await _stream_report(run_id, llm, messages)
 
     logger.info(f"Report generated: {len(report)} characters")
 
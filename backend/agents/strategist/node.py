@@ -135,7 +135,7 @@ async def strategist_node(
     response = await llm.ainvoke(messages)
     analysis = response.content.strip()
 
-    logger.info(f"Generated strategic feedback for retry: {analysis[:100]}...")
+    logger.info("Generated strategic feedback for retry: %.100s...", analysis)
 
     # Build structured feedback for the decision node
     feedback = f"""Note: This feedback is from a PREVIOUS execution cycle that was evaluated and rejected.
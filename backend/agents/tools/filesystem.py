@@ -8,6 +8,7 @@ import asyncio
 import hashlib
 import logging
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -56,9 +57,12 @@ async def read_file(file_path: str, max_lines: Optional[int] = None) -> str:
         return f"Error reading file: {e}"
 
 
+@lru_cache(maxsize=1024)
 def get_command_hash(command: str) -> str:
     """Generate hash for command approval tracking."""
-    return hashlib.md5(command.encode()).hexdigest()
+    # Lookup key only, not a security primitive; a 16-byte BLAKE2b digest
+    # keeps the same 32-char hex length as the previous MD5 keys
+    return hashlib.blake2b(command.encode(), digest_size=16).hexdigest()
 
 
 async def execute_command(
@@ -103,15 +107,17 @@ async def execute_command(
                 command=command,
             )
 
-        # Combine output
-        output = stdout.decode("utf-8", errors="replace")
+        # Combine output in one join so large stdout is not copied per section
+        parts = [stdout.decode("utf-8", errors="replace")]
         errors = stderr.decode("utf-8", errors="replace")
 
         if errors:
-            output += f"\n\nSTDERR:\n{errors}"
+            parts.append(f"\n\nSTDERR:\n{errors}")
 
         if process.returncode != 0:
-            output += f"\n\nExit code: {process.returncode}"
+            parts.append(f"\n\nExit code: {process.returncode}")
+
+        output = "".join(parts)
 
         logger.info(f"Command completed: exit={process.returncode}")
         return output.strip() or "(no output)"
@@ -23,7 +23,7 @@ async def answer_from_knowledge(answer: str) -> str:
     Returns:
         The answer (echoed back for state tracking)
     """
-    logger.info(f"Knowledge answer provided: {answer[:100]}...")
+    logger.info("Knowledge answer provided: %.100s...", answer)
     return f"Knowledge-based answer: {answer}"
 
 
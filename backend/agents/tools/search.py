@@ -6,10 +6,14 @@ Pipeline:
 2. Text chunking
 3. Bi-encoder semantic filtering (top-20 candidates) - async batched
 4. Cross-encoder reranking (top-3 final results) - async batched
+
+Final reports are cached in the app database for SEARCH_CACHE_TTL seconds.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import httpx
 import numpy as np
@@ -22,10 +26,19 @@ from backend.ml.text_processing import (
     get_embedding_batcher,
     get_model_manager,
 )
+from backend.persistence.database import get_db_service
 
 logger = logging.getLogger(__name__)
 
 
+class _Chunk(NamedTuple):
+    """A scraped text chunk and the page it came from."""
+
+    text: str
+    title: str
+    url: str
+
+
 async def intelligent_web_search(
     query: str,
     max_results: Optional[int] = None,
@@ -45,6 +58,34 @@ async def intelligent_web_search(
     max_results = max_results or config.search.max_search_results
     max_chunks = max_chunks or config.search.max_final_top_chunks
 
+    # Identical searches (same query and limits) within the TTL reuse the
+    # stored report instead of re-scraping and re-ranking. The chunking,
+    # model and threshold settings shape the report too, so they are part
+    # of the key and a reconfigured instance does not serve stale reports.
+    key_parts = (
+        query,
+        max_results,
+        max_chunks,
+        config.search.max_chunk_size,
+        config.search.chunk_overlap,
+        config.search.bi_encoder_threshold,
+        config.search.cross_encoder_threshold,
+        config.ml.bi_encoder_model,
+        config.ml.cross_encoder_model,
+    )
+    cache_key = hashlib.blake2b(
+        "\0".join(map(str, key_parts)).encode(), digest_size=16
+    ).hexdigest()
+    if config.search.cache_ttl > 0:
+        try:
+            db = await get_db_service()
+            cached = await db.get_cached_search(cache_key, config.search.cache_ttl)
+            if cached is not None:
+                logger.info(f"Search '{query}': served from cache")
+                return cached
+        except Exception as e:
+            logger.warning(f"Search cache lookup failed: {e}")
+
     # --- Step 1: Firecrawl Search ---
     try:
         search_url = f"{config.firecrawl.base_url}/v1/search"
@@ -91,7 +132,11 @@ async def intelligent_web_search(
     model_manager = get_model_manager()
     text_splitter = model_manager.get_text_splitter()
 
-    all_chunks = []
+    all_chunks: list[_Chunk] = []
+    # Bound once: these run for every chunk of every page
+    split_text = text_splitter.split_text
+    extend_chunks = all_chunks.extend
+
     for res in raw_results:
         url = res.get("url", "")
         title = res.get("title", "No Title")
@@ -100,12 +145,11 @@ async def intelligent_web_search(
         if not markdown:
             continue
 
-        raw_chunks = text_splitter.split_text(markdown)
-        for chunk in raw_chunks:
-            chunk = chunk.strip()
-            if len(chunk) < 10:
-                continue
-            all_chunks.append({"text": chunk, "title": title, "url": url})
+        extend_chunks(
+            _Chunk(chunk, title, url)
+            for raw in split_text(markdown)
+            if len(chunk := raw.strip()) >= 10
+        )
 
     if not all_chunks:
         logger.warning(f"No content extracted for query '{query}'")
@@ -115,26 +159,26 @@ async def intelligent_web_search(
 
     # --- Step 3: Bi-Encoder Filtering (async batched) ---
     embedding_batcher = get_embedding_batcher()
-    chunk_texts = [c["text"] for c in all_chunks]
+    chunk_texts = [c.text for c in all_chunks]
 
-    # Encode query and chunks via async batcher
-    query_embed = await embedding_batcher.encode([query])
-    corpus_embeds = await embedding_batcher.encode(chunk_texts)
+    # Encode query and chunks via async batcher. Submitting both at once lets
+    # them share a batch instead of each waiting out its own batch window.
+    query_embed, corpus_embeds = await asyncio.gather(
+        embedding_batcher.encode([query]),
+        embedding_batcher.encode(chunk_texts),
+    )
 
     # Convert to tensors for similarity computation
     query_tensor = torch.from_numpy(query_embed[0]).unsqueeze(0)
-    corpus_tensor = torch.from_numpy(np.array(corpus_embeds))
+    corpus_tensor = torch.from_numpy(np.asarray(corpus_embeds))
 
     top_k = min(20, len(all_chunks))
     cos_scores = util.cos_sim(query_tensor, corpus_tensor)[0]
     top_results = torch.topk(cos_scores, k=top_k)
 
-    candidates = []
-    for score, idx in zip(top_results.values, top_results.indices):
-        idx = idx.item()
-        if score.item() < config.search.bi_encoder_threshold:
-            continue
-        candidates.append(all_chunks[idx])
+    # Threshold the whole top-k slice at once instead of per-element .item() calls
+    keep = top_results.values >= config.search.bi_encoder_threshold
+    candidates = [all_chunks[idx] for idx in top_results.indices[keep].tolist()]
 
     if not candidates:
         logger.info(f"Bi-encoder filtered out all chunks for '{query}'")
@@ -144,38 +188,33 @@ async def intelligent_web_search(
 
     # --- Step 4: Cross-Encoder Reranking (async batched) ---
     cross_encoder_batcher = get_cross_encoder_batcher()
-    cross_inp = [[query, item["text"]] for item in candidates]
-    cross_scores = await cross_encoder_batcher.predict(cross_inp)
+    cross_inp = [[query, item.text] for item in candidates]
+    cross_scores = np.asarray(await cross_encoder_batcher.predict(cross_inp))
 
-    scored = [
-        {"item": item, "score": cross_scores[i]}
-        for i, item in enumerate(candidates)
-    ]
-    scored.sort(key=lambda x: x["score"], reverse=True)
+    # Rank on the score array directly (stable, so ties keep candidate order)
+    order = np.argsort(-cross_scores, kind="stable")[:max_chunks]
 
     # --- Step 5: Format Results ---
-    final_top = scored[:max_chunks]
+    final_top = [(candidates[i], cross_scores[i]) for i in order.tolist()]
     if not final_top:
         return "Information found but filtered as not precise enough."
 
     # Group by URL
     grouped = {}
-    for entry in final_top:
-        score = entry["score"]
-        item = entry["item"]
-        url = item["url"]
+    for item, score in final_top:
+        url = item.url
 
         if score < config.search.cross_encoder_threshold:
             continue
 
         if url not in grouped:
             grouped[url] = {
-                "title": item["title"],
+                "title": item.title,
                 "snippets": [],
                 "max_score": float("-inf"),
             }
 
-        grouped[url]["snippets"].append({"text": item["text"], "score": score})
+        grouped[url]["snippets"].append({"text": item.text, "score": score})
         grouped[url]["max_score"] = max(grouped[url]["max_score"], score)
 
     if not grouped:
@@ -202,4 +241,14 @@ async def intelligent_web_search(
     logger.info(
         f"Search '{query}': {len(final_top)} snippets from {len(sorted_urls)} sources"
     )
-    return "\n".join(lines)
+    report = "\n".join(lines)
+
+    # Only complete reports are cached; errors and empty results are retried
+    if config.search.cache_ttl > 0:
+        try:
+            db = await get_db_service()
+            await db.set_cached_search(cache_key, report)
+        except Exception as e:
+            logger.warning(f"Search cache store failed: {e}")
+
+    return report
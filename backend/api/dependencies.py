@@ -4,6 +4,7 @@ FastAPI dependencies for authentication and database access.
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
@@ -56,10 +57,15 @@ def create_access_token(user: User) -> str:
     )
 
 
+@lru_cache(maxsize=1024)
 def decode_token(token: str) -> Optional[TokenData]:
     """
     Decode and validate JWT token.
 
+    Results are cached per token string, so repeated requests with the same
+    bearer token skip signature verification. Expiry is still checked by
+    the caller on every request.
+
     Args:
         token: JWT token string
 
@@ -20,19 +20,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-class ApprovalItem(BaseModel):
-    """Response model for an approval item."""
-
-    command_hash: str
-    run_id: str
-    command_text: str
-    approved: int  # 0 = pending, 1 = approved, -1 = denied
-
-
 class PendingApprovalsResponse(BaseModel):
     """Response model for pending approvals."""
 
-    approvals: List[ApprovalItem]
+    approvals: List[Approval]
     count: int
 
 
@@ -60,18 +51,8 @@ async def get_pending_approvals(
 
     approvals = await db.get_pending_approvals(run_id)
 
-    return PendingApprovalsResponse(
-        approvals=[
-            ApprovalItem(
-                command_hash=a.command_hash,
-                run_id=a.run_id,
-                command_text=a.command_text,
-                approved=a.approved,
-            )
-            for a in approvals
-        ],
-        count=len(approvals),
-    )
+    # Approval models are passed through as-is; no per-row copy is needed
+    return PendingApprovalsResponse(approvals=approvals, count=len(approvals))
 
 
 @router.post("/{run_id}/{command_hash}")
@@ -7,11 +7,16 @@ Start, pause, resume, and manage research graph execution.
 import logging
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from backend.api.dependencies import get_current_user
-from backend.api.websocket import WSEventType, create_ws_event, get_connection_manager
+from backend.api.websocket import (
+    WSEventType,
+    create_ws_event,
+    get_connection_manager,
+    serialize_messages,
+)
 from backend.persistence.database import DatabaseService, get_db_service
 from backend.persistence.models import User
 
@@ -49,6 +54,7 @@ class ResearchStateResponse(BaseModel):
     plan: List[Dict[str, Any]]
     current_step_index: int
     messages: List[Dict[str, Any]]
+    message_count: int = 0  # Total messages in state; pass as `since` to fetch only newer ones
     is_running: bool
 
 
@@ -197,6 +203,7 @@ async def resume_interrupted(
     background_tasks.add_task(
         service.resume_interrupted,
         run_id=request.run_id,
+        run=run,
     )
 
     # Broadcast start event
@@ -250,7 +257,7 @@ async def send_message(
     service = await get_research_service()
 
     # Check if state exists (research has been started before)
-    existing_state = await service.get_state(request.run_id)
+    existing_state = await service.get_state(request.run_id, run=run)
 
     if existing_state is None:
         # No state exists - this is the first message, start research
@@ -281,6 +288,7 @@ async def send_message(
             service.resume_with_input,
             run_id=request.run_id,
             user_input=request.message,
+            run=run,
         )
 
         return {
@@ -293,6 +301,8 @@ async def send_message(
 @router.get("/state/{run_id}", response_model=ResearchStateResponse)
 async def get_research_state(
     run_id: str,
+    limit: Optional[int] = Query(None, ge=0, description="Return only the newest N messages"),
+    since: int = Query(0, ge=0, description="Skip messages the client already has"),
     current_user: User = Depends(get_current_user),
     db: DatabaseService = Depends(get_db_service),
 ):
@@ -315,7 +325,7 @@ async def get_research_state(
     from backend.services.research_service import get_research_service
 
     service = await get_research_service()
-    state = await service.get_state(run_id)
+    state = await service.get_state(run_id, run=run)
 
     if not state:
         return ResearchStateResponse(
@@ -327,15 +337,8 @@ async def get_research_state(
             is_running=False,
         )
 
-    # Convert messages to dicts
-    messages = []
-    for msg in state.get("messages", []):
-        if hasattr(msg, "content"):
-            messages.append({
-                "role": getattr(msg, "type", "unknown"),
-                "content": msg.content,
-                "name": getattr(msg, "name", None),
-            })
+    state_messages = state.get("messages", [])
+    messages = serialize_messages(state_messages, limit=limit, since=since)
 
     return ResearchStateResponse(
         run_id=run_id,
@@ -343,5 +346,6 @@ async def get_research_state(
         plan=state.get("plan", []),
         current_step_index=state.get("current_step_index", 0),
         messages=messages,
+        message_count=len(state_messages),
         is_running=run.status == "active",  # Use DB status as source of truth
     )
@@ -7,7 +7,7 @@ CRUD operations for research runs.
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from backend.api.dependencies import get_current_user
@@ -38,13 +38,19 @@ class RunListResponse(BaseModel):
 
 @router.get("", response_model=RunListResponse)
 async def list_runs(
+    limit: Optional[int] = Query(None, ge=1, description="Return only the newest N runs"),
     current_user: User = Depends(get_current_user),
     db: DatabaseService = Depends(get_db_service),
 ):
     """
-    List all runs for the current user.
+    List runs for the current user, newest first.
     """
-    runs = await db.get_user_runs(current_user.id)
+    runs = await db.get_user_runs(current_user.id, limit=limit)
+
+    # A full page may be truncated; only then is a separate count needed
+    total = len(runs)
+    if limit is not None and total == limit:
+        total = await db.count_user_runs(current_user.id)
 
     return RunListResponse(
         runs=[
@@ -57,7 +63,7 @@ async def list_runs(
             )
             for r in runs
         ],
-        total=len(runs),
+        total=total,
     )
 
 
@@ -70,7 +76,7 @@ async def create_run(
     """
     Create a new research run.
     """
-    logger.info(f"Creating run for user {current_user.id}: {run_data.title[:50]}")
+    logger.info("Creating run for user %s: %.50s", current_user.id, run_data.title)
 
     run = await db.create_run(current_user.id, run_data.title)
 
@@ -5,13 +5,31 @@ Manages WebSocket connections per run_id and broadcasts events.
 """
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional, Set
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
+from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
 
+# Max runs whose serialized message history is kept in memory
+_MESSAGE_CACHE_SIZE = 64
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:  # optional speedup
+
+    def _dumps(data: Any) -> str:
+        # Same encoding as WebSocket.send_json
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 
 class ConnectionManager:
     """
@@ -73,11 +91,12 @@ class ConnectionManager:
         if not connections:
             return
 
-        # Send to all connections, removing dead ones
+        # Encode once for all receivers, removing dead connections
+        payload = _dumps(message)
         dead_connections = []
         for ws in connections:
             try:
-                await ws.send_json(message)
+                await ws.send_text(payload)
             except Exception as e:
                 logger.debug(f"Failed to send to WebSocket: {e}")
                 dead_connections.append(ws)
@@ -104,7 +123,7 @@ class ConnectionManager:
             True if sent successfully, False otherwise
         """
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(_dumps(message))
             return True
         except Exception as e:
             logger.debug(f"Failed to send personal message: {e}")
@@ -146,6 +165,7 @@ class WSEventType:
 
     # Messages
     MESSAGE = "message"
+    MESSAGE_DELTA = "message_delta"
     TOOL_CALL = "tool_call"
 
     # Research progress
@@ -185,3 +205,121 @@ def create_ws_event(event_type: str, **data) -> dict:
         Event dict ready for JSON serialization
     """
     return {"type": event_type, **data}
+
+
+# LangChain message types -> chat roles understood by the frontend
+_ROLE_BY_TYPE = {
+    "human": "user",
+    "ai": "assistant",
+    "system": "system",
+    "tool": "tool",
+}
+
+
+def _content_text(content: Any) -> str:
+    """Flatten message content (plain string or list of content blocks) to text."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else text
+        for block in content
+        if isinstance(block, str) or (isinstance(block, dict) and (text := block.get("text")))
+    )
+
+
+def message_fields(msg: Any) -> Optional[tuple[str, str, Optional[str]]]:
+    """
+    Extract (role, content, name) from a graph state message.
+
+    Args:
+        msg: LangChain message (anything else is skipped)
+
+    Returns:
+        Field tuple, or None if the object is not a message or has no content
+    """
+    # Bail out before any flattening for non-messages and empty content
+    # (e.g. AI messages that only carry tool calls)
+    if not isinstance(msg, BaseMessage) or not msg.content:
+        return None
+    content = _content_text(msg.content)
+    if not content:
+        return None
+    return _ROLE_BY_TYPE.get(msg.type, msg.type), content, msg.name
+
+
+def serialize_messages(
+    messages: Sequence[Any],
+    limit: Optional[int] = None,
+    since: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Convert graph state messages to JSON-ready dicts.
+
+    Args:
+        messages: Messages from the graph state
+        limit: If provided, only the newest `limit` messages are converted
+        since: Skip the first `since` messages (already seen by the client).
+            The state message list is append-only, so its length can be
+            used as the next `since` value.
+
+    Returns:
+        List of {role, content, name} dicts in chronological order
+    """
+    if since > 0:
+        messages = messages[since:]
+    if limit is not None:
+        messages = messages[-limit:] if limit > 0 else []
+
+    return [
+        {"role": fields[0], "content": fields[1], "name": fields[2]}
+        for fields in map(message_fields, messages)
+        if fields is not None
+    ]
+
+
+# run_id -> (raw message count, id of the last raw message, serialized messages)
+_message_cache: "OrderedDict[str, tuple[int, Optional[str], List[Dict[str, Any]]]]" = (
+    OrderedDict()
+)
+
+
+def serialize_run_messages(run_id: str, messages: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    Serialize a run's full message history, reusing earlier work.
+
+    The state message list is append-only, so the cache is keyed on its tip
+    (length and last message id): an unchanged history is returned as is and
+    a grown one only converts the new messages.
+
+    Args:
+        run_id: Run the messages belong to
+        messages: Messages from the graph state
+
+    Returns:
+        List of {role, content, name} dicts in chronological order
+    """
+    count = len(messages)
+    tip_id = getattr(messages[-1], "id", None) if messages else None
+
+    cached = _message_cache.get(run_id)
+    if cached is not None:
+        cached_count, cached_tip_id, serialized = cached
+        if cached_count == count and cached_tip_id == tip_id:
+            _message_cache.move_to_end(run_id)
+            return serialized
+        # Grown history whose old tip is still in place: convert the tail only
+        if (
+            0 < cached_count < count
+            and getattr(messages[cached_count - 1], "id", None) == cached_tip_id
+        ):
+            serialized = serialized + serialize_messages(messages, since=cached_count)
+        else:
+            serialized = serialize_messages(messages)
+    else:
+        serialized = serialize_messages(messages)
+
+    _message_cache[run_id] = (count, tip_id, serialized)
+    _message_cache.move_to_end(run_id)
+    if len(_message_cache) > _MESSAGE_CACHE_SIZE:
+        _message_cache.popitem(last=False)
+    return serialized
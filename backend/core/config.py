@@ -104,6 +104,8 @@ class SearchSettings(BaseSettings):
     chunk_overlap: int = Field(default=150, ge=0, le=500, alias="CHUNK_OVERLAP")
     bi_encoder_threshold: float = Field(default=0.2, ge=0.0, le=1.0, alias="BI_ENCODER_THRESHOLD")
     cross_encoder_threshold: float = Field(default=-1.0, ge=-10.0, le=10.0, alias="CROSS_ENCODER_THRESHOLD")
+    # Seconds a search result is reused for an identical query (0 = no caching)
+    cache_ttl: int = Field(default=3600, ge=0, alias="SEARCH_CACHE_TTL")
 
 
 class FirecrawlSettings(BaseSettings):
@@ -122,6 +124,8 @@ class DatabaseSettings(BaseSettings):
 
     app_db_name: str = Field(default="app.db", alias="APP_DB_NAME")
     langgraph_db_name: str = Field(default="langgraph.db", alias="LANGGRAPH_DB_NAME")
+    # Periodic WAL checkpoint + PRAGMA optimize (0 disables)
+    maintenance_interval: int = Field(default=900, ge=0, alias="DB_MAINTENANCE_INTERVAL")
     # Base dir relative to project root
     base_dir: Path = Field(
         default=Path(__file__).resolve().parent.parent.parent / "db",
@@ -7,9 +7,13 @@ Includes token tracking with async callback support.
 
 import json
 import logging
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import Any, Callable, Coroutine, Optional, Type, TypeVar
 
 from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import LLMResult
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
@@ -17,6 +21,20 @@ from backend.core.config import config
 
 logger = logging.getLogger(__name__)
 
+# usage_metadata is a TypedDict in current langchain, an object in older releases
+_USAGE_ITEMS = itemgetter("input_tokens", "output_tokens")
+_USAGE_ATTRS = attrgetter("input_tokens", "output_tokens")
+
+
+def _usage_tokens(usage: Any) -> tuple[int, int]:
+    """Read (input_tokens, output_tokens) from a usage_metadata value."""
+    getter = _USAGE_ITEMS if isinstance(usage, dict) else _USAGE_ATTRS
+    try:
+        input_tokens, output_tokens = getter(usage)
+    except (KeyError, AttributeError):
+        return 0, 0
+    return input_tokens or 0, output_tokens or 0
+
 
 class TokenTrackingCallback(AsyncCallbackHandler):
     """
@@ -36,50 +54,46 @@ class TokenTrackingCallback(AsyncCallbackHandler):
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
-    async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Called when LLM finishes. Extract token usage from response."""
         try:
             input_tokens = 0
             output_tokens = 0
 
-            logger.debug(f"on_llm_end called for run {self.run_id}, response type: {type(response).__name__}")
+            logger.debug("on_llm_end called for run %s", self.run_id)
+
+            # Resolve the first generation and its message once; only
+            # ChatGeneration carries a message
+            generations = response.generations
+            gen = generations[0][0] if generations and generations[0] else None
+            message = getattr(gen, "message", None)
 
             # Method 1: Try llm_output.token_usage (OpenAI standard)
-            if hasattr(response, "llm_output") and response.llm_output:
+            if response.llm_output:
                 token_usage = response.llm_output.get("token_usage", {})
                 if token_usage:
-                    logger.debug(f"Found token_usage in llm_output: {token_usage}")
+                    logger.debug("Found token_usage in llm_output: %s", token_usage)
                 input_tokens = token_usage.get("prompt_tokens", 0)
                 output_tokens = token_usage.get("completion_tokens", 0)
 
             # Method 2: Try generation's usage_metadata (modern langchain)
-            if input_tokens == 0 and output_tokens == 0:
-                if hasattr(response, "generations") and response.generations:
-                    gen = response.generations[0][0] if response.generations[0] else None
-                    if gen:
-                        # Check usage_metadata on the message
-                        if hasattr(gen, "message") and hasattr(gen.message, "usage_metadata"):
-                            usage = gen.message.usage_metadata
-                            if usage:
-                                input_tokens = getattr(usage, "input_tokens", 0) or 0
-                                output_tokens = getattr(usage, "output_tokens", 0) or 0
-
-                        # Fallback: Check generation_info
-                        if input_tokens == 0 and output_tokens == 0:
-                            if hasattr(gen, "generation_info") and gen.generation_info:
-                                input_tokens = gen.generation_info.get("prompt_tokens", 0)
-                                output_tokens = gen.generation_info.get("completion_tokens", 0)
+            if input_tokens == 0 and output_tokens == 0 and message is not None:
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    input_tokens, output_tokens = _usage_tokens(usage)
+
+            # Fallback: Check generation_info
+            if input_tokens == 0 and output_tokens == 0 and gen is not None and gen.generation_info:
+                input_tokens = gen.generation_info.get("prompt_tokens", 0)
+                output_tokens = gen.generation_info.get("completion_tokens", 0)
 
             # Method 3: Try response_metadata on generation message
-            if input_tokens == 0 and output_tokens == 0:
-                if hasattr(response, "generations") and response.generations:
-                    gen = response.generations[0][0] if response.generations[0] else None
-                    if gen and hasattr(gen, "message") and hasattr(gen.message, "response_metadata"):
-                        metadata = gen.message.response_metadata
-                        if metadata:
-                            token_usage = metadata.get("token_usage", {})
-                            input_tokens = token_usage.get("prompt_tokens", 0)
-                            output_tokens = token_usage.get("completion_tokens", 0)
+            if input_tokens == 0 and output_tokens == 0 and message is not None:
+                metadata = message.response_metadata
+                if metadata:
+                    token_usage = metadata.get("token_usage", {})
+                    input_tokens = token_usage.get("prompt_tokens", 0)
+                    output_tokens = token_usage.get("completion_tokens", 0)
 
             self.total_input_tokens += input_tokens
             self.total_output_tokens += output_tokens
@@ -158,6 +172,8 @@ class LLMProvider:
             temperature=temperature,
             max_tokens=max_tokens,
             callbacks=callbacks if callbacks else None,
+            # Report usage on streamed calls too, so token tracking still works
+            stream_usage=True,
         )
 
     def get_creative_llm(
@@ -257,16 +273,21 @@ def extract_tokens_from_response(response: Any) -> tuple[int, int]:
     input_tokens = 0
     output_tokens = 0
 
-    # Method 1: usage_metadata (modern langchain)
-    if hasattr(response, "usage_metadata") and response.usage_metadata:
+    # AIMessage always defines both fields, only unknown types need reflection
+    if isinstance(response, AIMessage):
         usage = response.usage_metadata
-        input_tokens = getattr(usage, "input_tokens", 0) or 0
-        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        metadata = response.response_metadata
+    else:
+        usage = getattr(response, "usage_metadata", None)
+        metadata = getattr(response, "response_metadata", None)
+
+    # Method 1: usage_metadata (modern langchain)
+    if usage:
+        input_tokens, output_tokens = _usage_tokens(usage)
 
     # Method 2: response_metadata.token_usage (OpenAI format)
     if input_tokens == 0 and output_tokens == 0:
-        if hasattr(response, "response_metadata") and response.response_metadata:
-            metadata = response.response_metadata
+        if metadata:
             token_usage = metadata.get("token_usage", {})
             input_tokens = token_usage.get("prompt_tokens", 0)
             output_tokens = token_usage.get("completion_tokens", 0)
@@ -299,9 +320,9 @@ async def track_response_tokens(run_id: str, response: Any) -> int:
             except Exception as e:
                 logger.warning(f"Failed to call token callback: {e}")
 
-        logger.debug(f"Tracked tokens for run {run_id}: {input_tokens} in, {output_tokens} out")
+        logger.debug("Tracked tokens for run %s: %d in, %d out", run_id, input_tokens, output_tokens)
     else:
-        logger.debug(f"No token info in response for run {run_id}")
+        logger.debug("No token info in response for run %s", run_id)
 
     return total
 
@@ -309,9 +330,15 @@ async def track_response_tokens(run_id: str, response: Any) -> int:
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=1024)
+def _schema_json(schema: Type[BaseModel]) -> str:
+    """Serialize a model's JSON schema once per schema class."""
+    return json.dumps(schema.model_json_schema(), indent=2, ensure_ascii=False)
+
+
 def _build_json_schema_prompt(schema: Type[T], prompt: str) -> str:
     """Build a prompt that asks for JSON output matching the schema."""
-    schema_json = json.dumps(schema.model_json_schema(), indent=2)
+    schema_json = _schema_json(schema)
     return f"""{prompt}
 
 You MUST respond with valid JSON matching this schema:
@@ -324,13 +351,13 @@ def _parse_json_content(content: str, schema: Type[T]) -> T:
     """Parse JSON from content, handling markdown code blocks."""
     json_str = content.strip()
 
-    # Remove markdown code blocks if present
-    if "```json" in json_str:
-        json_str = json_str.split("```json")[1].split("```")[0].strip()
-    elif "```" in json_str:
-        parts = json_str.split("```")
-        if len(parts) >= 2:
-            json_str = parts[1].strip()
+    # Remove markdown code blocks if present. partition stops at the first
+    # fence instead of splitting the whole reply on every one.
+    _, fence, rest = json_str.partition("```json")
+    if not fence:
+        _, fence, rest = json_str.partition("```")
+    if fence:
+        json_str = rest.partition("```")[0].strip()
 
     data = json.loads(json_str)
     return schema.model_validate(data)
@@ -363,7 +390,8 @@ async def invoke_structured_output(
     structured_llm = llm.with_structured_output(schema, include_raw=True)
     result = await structured_llm.ainvoke(prompt)
 
-    logger.debug(f"Structured output result keys: {result.keys() if result else 'None'}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Structured output result keys: %s", result.keys() if result else None)
 
     # If parsed successfully, return it
     if result.get("parsed"):
@@ -374,23 +402,29 @@ async def invoke_structured_output(
     parsing_error = result.get("parsing_error")
 
     if parsing_error:
-        logger.debug(f"Structured output parsing error: {parsing_error}")
+        logger.debug("Structured output parsing error: %s", parsing_error)
 
     # Try to extract from tool_calls (some models return structured output this way)
-    if raw and hasattr(raw, "tool_calls") and raw.tool_calls:
+    tool_calls = getattr(raw, "tool_calls", None)
+    if tool_calls:
         try:
-            tool_call = raw.tool_calls[0]
-            args = tool_call.get("args", {}) if isinstance(tool_call, dict) else getattr(tool_call, "args", {})
+            tool_call = tool_calls[0]
+            # LangChain tool calls are plain dicts; other objects only carry .args
+            try:
+                args = tool_call.get("args", {})
+            except AttributeError:
+                args = getattr(tool_call, "args", {})
             if args:
-                logger.debug(f"Extracted args from tool_calls: {args}")
+                logger.debug("Extracted args from tool_calls: %s", args)
                 return schema.model_validate(args)
         except Exception as e:
             logger.warning(f"Failed to parse from tool_calls: {e}")
 
     # Try to parse from content
-    if raw and hasattr(raw, "content") and raw.content:
+    content = getattr(raw, "content", None)
+    if content:
         try:
-            return _parse_json_content(raw.content, schema)
+            return _parse_json_content(content, schema)
         except (json.JSONDecodeError, IndexError, Exception) as e:
             logger.warning(f"Failed to parse JSON from content: {e}")
 
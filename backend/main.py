@@ -4,6 +4,7 @@ FastAPI application entry point.
 Main application with lifespan management for startup/shutdown.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -12,7 +13,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.api.routes import api_router
-from backend.api.websocket import get_connection_manager
+from backend.api.websocket import get_connection_manager, serialize_run_messages
 from backend.core.config import config
 from backend.core.checkpointer import get_checkpointer, close_checkpointer
 from backend.core.logging import setup_logging
@@ -26,6 +27,43 @@ setup_logging(
 logger = logging.getLogger(__name__)
 
 
+async def _db_maintenance_loop(db, interval: int) -> None:
+    """Periodically checkpoint the WAL and refresh SQLite statistics."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await db.run_maintenance()
+        except Exception as e:
+            logger.warning(f"Database maintenance failed: {e}")
+
+
+async def _build_state_sync(db, run_id: str) -> dict:
+    """Build the state_sync payload sent on connect and on request_state."""
+    from backend.services.research_service import get_research_service
+
+    service = await get_research_service()
+
+    # Get run from database - single source of truth for status
+    run = await db.get_run(run_id)
+    state = await service.get_state(run_id, run=run) if run else None
+    run_status = run.status if run else "unknown"
+
+    if not state:
+        state = {}
+    return {
+        "type": "state_sync",
+        "run_id": run_id,
+        "is_running": run_status == "active",
+        "run_status": run_status,
+        "phase": state.get("phase", "idle"),
+        "plan": state.get("plan", []),
+        "current_step_index": state.get("current_step_index", 0),
+        "search_themes": state.get("search_themes", []),
+        "messages": serialize_run_messages(run_id, state.get("messages", [])),
+        "pending_terminal": state.get("pending_terminal"),
+    }
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -56,12 +94,21 @@ async def lifespan(app: FastAPI):
     # Store services in app state for access in routes
     app.state.db = db
 
+    maintenance_task = None
+    if config.database.maintenance_interval > 0:
+        maintenance_task = asyncio.create_task(
+            _db_maintenance_loop(db, config.database.maintenance_interval)
+        )
+
     logger.info("Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    if maintenance_task:
+        maintenance_task.cancel()
+    await db.close()
     await close_checkpointer()
     logger.info("Application shutdown complete")
 
@@ -116,44 +163,11 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
             "message": "WebSocket connected successfully",
         })
 
-        # Send current state sync
-        from backend.services.research_service import get_research_service
+        # Send current state sync. It carries the full message history, so
+        # it goes through the manager's faster encoder.
         try:
-            service = await get_research_service()
-            state = await service.get_state(run_id)
-
-            # Get run from database - single source of truth for status
-            db = websocket.app.state.db
-            run = await db.get_run(run_id)
-            run_status = run.status if run else "unknown"
-            is_running = run_status == "active"
-
-            # Convert messages to dicts
-            messages = []
-            if state:
-                for msg in state.get("messages", []):
-                    if hasattr(msg, "content"):
-                        messages.append({
-                            "role": getattr(msg, "type", "unknown"),
-                            "content": msg.content,
-                            "name": getattr(msg, "name", None),
-                        })
-
-            phase = state.get("phase", "idle") if state else "idle"
-            pending_terminal = state.get("pending_terminal") if state else None
-
-            await websocket.send_json({
-                "type": "state_sync",
-                "run_id": run_id,
-                "is_running": is_running,
-                "run_status": run_status,
-                "phase": phase,
-                "plan": state.get("plan", []) if state else [],
-                "current_step_index": state.get("current_step_index", 0) if state else 0,
-                "search_themes": state.get("search_themes", []) if state else [],
-                "messages": messages,
-                "pending_terminal": pending_terminal,
-            })
+            payload = await _build_state_sync(websocket.app.state.db, run_id)
+            await manager.send_personal(run_id, websocket, payload)
         except Exception as e:
             logger.warning(f"Failed to send state sync for run {run_id}: {e}")
 
@@ -168,43 +182,9 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
                     await websocket.send_json({"type": "pong"})
                 elif data.get("type") == "request_state":
                     # Client requests state refresh
-                    from backend.services.research_service import get_research_service
                     try:
-                        service = await get_research_service()
-                        state = await service.get_state(run_id)
-
-                        # Get run from database - single source of truth for status
-                        db = websocket.app.state.db
-                        run = await db.get_run(run_id)
-                        run_status = run.status if run else "unknown"
-                        is_running = run_status == "active"
-
-                        # Convert messages to dicts
-                        messages = []
-                        if state:
-                            for msg in state.get("messages", []):
-                                if hasattr(msg, "content"):
-                                    messages.append({
-                                        "role": getattr(msg, "type", "unknown"),
-                                        "content": msg.content,
-                                        "name": getattr(msg, "name", None),
-                                    })
-
-                        phase = state.get("phase", "idle") if state else "idle"
-                        pending_terminal = state.get("pending_terminal") if state else None
-
-                        await websocket.send_json({
-                            "type": "state_sync",
-                            "run_id": run_id,
-                            "is_running": is_running,
-                            "run_status": run_status,
-                            "phase": phase,
-                            "plan": state.get("plan", []) if state else [],
-                            "current_step_index": state.get("current_step_index", 0) if state else 0,
-                            "search_themes": state.get("search_themes", []) if state else [],
-                            "messages": messages,
-                            "pending_terminal": pending_terminal,
-                        })
+                        payload = await _build_state_sync(websocket.app.state.db, run_id)
+                        await manager.send_personal(run_id, websocket, payload)
                     except Exception as e:
                         logger.warning(f"Failed to send state for run {run_id}: {e}")
 
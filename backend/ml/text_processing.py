@@ -229,12 +229,9 @@ class AsyncEmbeddingBatcher:
             try:
                 batch_items: list[tuple[list[str], asyncio.Future]] = []
 
-                # Wait for first item
-                try:
-                    item = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                    batch_items.append(item)
-                except asyncio.TimeoutError:
-                    continue
+                # Sleep until the first item arrives; stop() cancels this wait,
+                # so an idle batcher never wakes up just to poll
+                batch_items.append(await self._queue.get())
 
                 # Collect more items within max_wait window
                 deadline = asyncio.get_event_loop().time() + max_wait
@@ -352,12 +349,9 @@ class AsyncCrossEncoderBatcher:
             try:
                 batch_items: list[tuple[list[list[str]], asyncio.Future]] = []
 
-                # Wait for first item
-                try:
-                    item = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                    batch_items.append(item)
-                except asyncio.TimeoutError:
-                    continue
+                # Sleep until the first item arrives; stop() cancels this wait,
+                # so an idle batcher never wakes up just to poll
+                batch_items.append(await self._queue.get())
 
                 # Collect more items within max_wait window
                 deadline = asyncio.get_event_loop().time() + max_wait
@@ -5,13 +5,17 @@ Simplified for LangGraph - handles only:
 - Users (auth)
 - Runs (metadata)
 - Approvals (command execution approval)
+- Search cache (web search results reused across runs)
 
 Graph state is managed by LangGraph checkpointer.
 """
 
+import asyncio
 import logging
 import os
+import time
 import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import List, Optional
 
@@ -24,28 +28,72 @@ from backend.persistence.models import User, Run, Approval
 
 logger = logging.getLogger(__name__)
 
+_USER_CACHE_SIZE = 256
+_RUN_CACHE_SIZE = 256
+
+# Columns backing the Approval model (created_at is never read)
+_APPROVAL_COLUMNS = "command_hash, run_id, command_text, approved"
+
+# Applied to every connection. journal_mode=WAL is persistent in the
+# database file, so it is only set once in init_db.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-16000;
+    PRAGMA mmap_size=268435456;
+"""
+
 
 class DatabaseService:
     """
     Async database service for user and run management.
 
     Uses aiosqlite for async SQLite operations with WAL mode.
+    A single long-lived connection is shared by all operations so the
+    page cache stays warm; access to it is serialized with a lock.
     """
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or config.database.app_db_path
         self._initialized = False
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_lock = asyncio.Lock()
+        # Users are immutable once created, so lookups by ID (one per
+        # authenticated request) can be served from a small LRU cache
+        self._user_cache: OrderedDict[str, User] = OrderedDict()
+        # Runs are looked up on nearly every request and WebSocket sync. All
+        # writes to them go through this service, which keeps the cache
+        # current: updates write through, other writes invalidate.
+        self._run_cache: OrderedDict[str, Run] = OrderedDict()
 
     @asynccontextmanager
     async def get_connection(self):
-        """Async context manager for database connection."""
-        conn = await aiosqlite.connect(self.db_path, timeout=30)
-        await conn.execute("PRAGMA journal_mode=WAL;")
-        conn.row_factory = aiosqlite.Row
-        try:
-            yield conn
-        finally:
-            await conn.close()
+        """
+        Async context manager for the shared database connection.
+
+        The connection is opened on first use. Work left uncommitted by a
+        failed operation is rolled back so it cannot leak into the next one.
+        """
+        async with self._conn_lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self.db_path, timeout=30)
+                await conn.executescript(_CONNECTION_PRAGMAS)
+                conn.row_factory = aiosqlite.Row
+                self._conn = conn
+
+            try:
+                yield self._conn
+            except BaseException:
+                if self._conn.in_transaction:
+                    await self._conn.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close the shared connection."""
+        async with self._conn_lock:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
 
     async def init_db(self) -> None:
         """Initialize database schema."""
@@ -60,6 +108,8 @@ class DatabaseService:
         logger.info(f"Initializing database at: {self.db_path}")
 
         async with self.get_connection() as conn:
+            await conn.execute("PRAGMA journal_mode=WAL;")
+
             # Users table
             await conn.execute("""
                 CREATE TABLE IF NOT EXISTS users (
@@ -96,19 +146,58 @@ class DatabaseService:
                 )
             """)
 
+            # Search result cache (key is a digest of the query and its limits)
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
             # Indexes
+            # Covers the per-user run listing including its ORDER BY, so
+            # SQLite can walk the index instead of sorting; supersedes the
+            # old single-column user_id index
             await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_runs_user_id ON runs(user_id)"
+                "CREATE INDEX IF NOT EXISTS idx_runs_user_id_created_at "
+                "ON runs(user_id, created_at DESC)"
             )
+            await conn.execute("DROP INDEX IF EXISTS idx_runs_user_id")
+            # Pending-approval lookups only touch the (few) unanswered rows.
+            # Plain run_id lookups are served by the primary key, which makes
+            # the old idx_approvals_run_id redundant.
             await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_approvals_run_id ON approvals(run_id)"
+                "CREATE INDEX IF NOT EXISTS idx_approvals_pending "
+                "ON approvals(run_id) WHERE approved = 0"
             )
+            await conn.execute("DROP INDEX IF EXISTS idx_approvals_run_id")
 
             await conn.commit()
 
+            # Gather planner statistics for the (possibly new) indexes
+            await conn.execute("PRAGMA optimize;")
+
         self._initialized = True
         logger.info("Database initialized successfully")
 
+    async def run_maintenance(self) -> None:
+        """
+        Prune expired search cache entries, checkpoint the WAL and refresh
+        query planner statistics.
+
+        Keeps the -wal file from growing unbounded between restarts.
+        """
+        async with self.get_connection() as conn:
+            # Drop search results no lookup would accept any more
+            await conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?",
+                (time.time() - config.search.cache_ttl,),
+            )
+            await conn.commit()
+            await conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+            await conn.execute("PRAGMA optimize;")
+
     # --- User Operations ---
 
     async def create_user(self, username: str, password: str) -> Optional[User]:
@@ -117,23 +206,22 @@ class DatabaseService:
 
         Returns None if username already exists.
         """
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+        # bcrypt is deliberately slow; keep it off the event loop
+        hashed = await asyncio.to_thread(
+            bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt()
+        )
         user_id = str(uuid.uuid4())
 
         try:
             async with self.get_connection() as conn:
-                await conn.execute(
-                    "INSERT INTO users (id, username, password_hash) VALUES (?, ?, ?)",
-                    (user_id, username, hashed.decode("utf-8")),
-                )
-                await conn.commit()
-
                 async with conn.execute(
-                    "SELECT id, username, created_at FROM users WHERE id = ?",
-                    (user_id,),
+                    "INSERT INTO users (id, username, password_hash) VALUES (?, ?, ?) "
+                    "RETURNING id, username, created_at",
+                    (user_id, username, hashed.decode("utf-8")),
                 ) as cursor:
                     row = await cursor.fetchone()
-                    return User(**dict(row)) if row else None
+                await conn.commit()
+                return User(**dict(row)) if row else None
 
         except aiosqlite.IntegrityError:
             logger.warning(f"Username '{username}' already exists")
@@ -157,8 +245,8 @@ class DatabaseService:
         if not row:
             return None
 
-        if bcrypt.checkpw(
-            password.encode("utf-8"), row["password_hash"].encode("utf-8")
+        if await asyncio.to_thread(
+            bcrypt.checkpw, password.encode("utf-8"), row["password_hash"].encode("utf-8")
         ):
             return User(
                 id=row["id"],
@@ -169,13 +257,26 @@ class DatabaseService:
 
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            self._user_cache.move_to_end(user_id)
+            return user
+
         async with self.get_connection() as conn:
             async with conn.execute(
                 "SELECT id, username, created_at FROM users WHERE id = ?",
                 (user_id,),
             ) as cursor:
                 row = await cursor.fetchone()
-                return User(**dict(row)) if row else None
+
+        if not row:
+            return None
+
+        user = User(**dict(row))
+        self._user_cache[user_id] = user
+        if len(self._user_cache) > _USER_CACHE_SIZE:
+            self._user_cache.popitem(last=False)
+        return user
 
     # --- Run Operations ---
 
@@ -184,37 +285,65 @@ class DatabaseService:
         run_id = str(uuid.uuid4())
 
         async with self.get_connection() as conn:
-            await conn.execute(
-                "INSERT INTO runs (id, user_id, title) VALUES (?, ?, ?)",
-                (run_id, user_id, title),
-            )
-            await conn.commit()
-
             async with conn.execute(
-                "SELECT * FROM runs WHERE id = ?", (run_id,)
+                "INSERT INTO runs (id, user_id, title) VALUES (?, ?, ?) RETURNING *",
+                (run_id, user_id, title),
             ) as cursor:
                 row = await cursor.fetchone()
-                return Run(**dict(row))
+            await conn.commit()
+            return self._cache_run(Run(**dict(row)))
+
+    def _cache_run(self, run: Run) -> Run:
+        """Store a freshly read run in the LRU cache and return it."""
+        self._run_cache[run.id] = run
+        self._run_cache.move_to_end(run.id)
+        if len(self._run_cache) > _RUN_CACHE_SIZE:
+            self._run_cache.popitem(last=False)
+        return run
 
     async def get_run(self, run_id: str) -> Optional[Run]:
         """Get run by ID."""
+        run = self._run_cache.get(run_id)
+        if run is not None:
+            self._run_cache.move_to_end(run_id)
+            return run
+
         async with self.get_connection() as conn:
             async with conn.execute(
                 "SELECT * FROM runs WHERE id = ?", (run_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                return Run(**dict(row)) if row else None
+        return self._cache_run(Run(**dict(row))) if row else None
+
+    async def get_user_runs(self, user_id: str, limit: Optional[int] = None) -> List[Run]:
+        """
+        Get runs for a user, ordered by creation date (newest first).
+
+        Args:
+            user_id: Owner of the runs
+            limit: Maximum number of runs to return (all runs if None).
+                Applied in SQL so only the requested rows are materialized.
+        """
+        query = "SELECT * FROM runs WHERE user_id = ? ORDER BY created_at DESC"
+        params: tuple = (user_id,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (user_id, limit)
 
-    async def get_user_runs(self, user_id: str) -> List[Run]:
-        """Get all runs for a user, ordered by creation date (newest first)."""
         async with self.get_connection() as conn:
-            async with conn.execute(
-                "SELECT * FROM runs WHERE user_id = ? ORDER BY created_at DESC",
-                (user_id,),
-            ) as cursor:
+            async with conn.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [Run(**dict(row)) for row in rows]
 
+    async def count_user_runs(self, user_id: str) -> int:
+        """Count a user's runs without loading them."""
+        async with self.get_connection() as conn:
+            async with conn.execute(
+                "SELECT COUNT(*) FROM runs WHERE user_id = ?", (user_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0]
+
     async def update_run(
         self,
         run_id: str,
@@ -238,13 +367,16 @@ class DatabaseService:
         values.append(run_id)
 
         async with self.get_connection() as conn:
-            await conn.execute(
-                f"UPDATE runs SET {', '.join(updates)} WHERE id = ?",
+            async with conn.execute(
+                f"UPDATE runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
                 values,
-            )
+            ) as cursor:
+                row = await cursor.fetchone()
             await conn.commit()
-
-        return await self.get_run(run_id)
+        if not row:
+            self._run_cache.pop(run_id, None)
+            return None
+        return self._cache_run(Run(**dict(row)))
 
     async def delete_run(self, run_id: str) -> bool:
         """Delete a run and its associated approvals."""
@@ -258,7 +390,8 @@ class DatabaseService:
                 "DELETE FROM runs WHERE id = ?", (run_id,)
             )
             await conn.commit()
-            return cursor.rowcount > 0
+        self._run_cache.pop(run_id, None)
+        return cursor.rowcount > 0
 
     async def increment_tokens(self, run_id: str, tokens: int) -> None:
         """Increment token usage for a run."""
@@ -268,6 +401,7 @@ class DatabaseService:
                 (tokens, run_id),
             )
             await conn.commit()
+        self._run_cache.pop(run_id, None)
 
     async def mark_active_runs_as_interrupted(self) -> int:
         """
@@ -281,6 +415,7 @@ class DatabaseService:
                 "UPDATE runs SET status = 'interrupted' WHERE status = 'active'"
             )
             await conn.commit()
+            self._run_cache.clear()
             count = cursor.rowcount
             if count > 0:
                 logger.info(f"Marked {count} active runs as interrupted due to server restart")
@@ -293,18 +428,23 @@ class DatabaseService:
     ) -> Approval:
         """Create a pending approval request."""
         async with self.get_connection() as conn:
-            await conn.execute(
-                "INSERT OR IGNORE INTO approvals (run_id, command_hash, command_text) VALUES (?, ?, ?)",
-                (run_id, command_hash, command_text),
-            )
-            await conn.commit()
-
             async with conn.execute(
-                "SELECT * FROM approvals WHERE run_id = ? AND command_hash = ?",
-                (run_id, command_hash),
+                "INSERT OR IGNORE INTO approvals (run_id, command_hash, command_text) "
+                f"VALUES (?, ?, ?) RETURNING {_APPROVAL_COLUMNS}",
+                (run_id, command_hash, command_text),
             ) as cursor:
                 row = await cursor.fetchone()
-                return Approval(**dict(row))
+            await conn.commit()
+
+            if row is None:
+                # Already requested: the ignored insert returns nothing
+                async with conn.execute(
+                    f"SELECT {_APPROVAL_COLUMNS} FROM approvals WHERE run_id = ? AND command_hash = ?",
+                    (run_id, command_hash),
+                ) as cursor:
+                    row = await cursor.fetchone()
+
+            return Approval(**dict(row))
 
     async def get_approval(
         self, run_id: str, command_hash: str
@@ -312,7 +452,7 @@ class DatabaseService:
         """Get approval by run_id and command_hash."""
         async with self.get_connection() as conn:
             async with conn.execute(
-                "SELECT * FROM approvals WHERE run_id = ? AND command_hash = ?",
+                f"SELECT {_APPROVAL_COLUMNS} FROM approvals WHERE run_id = ? AND command_hash = ?",
                 (run_id, command_hash),
             ) as cursor:
                 row = await cursor.fetchone()
@@ -322,7 +462,7 @@ class DatabaseService:
         """Get all pending approvals for a run."""
         async with self.get_connection() as conn:
             async with conn.execute(
-                "SELECT * FROM approvals WHERE run_id = ? AND approved = 0",
+                f"SELECT {_APPROVAL_COLUMNS} FROM approvals WHERE run_id = ? AND approved = 0",
                 (run_id,),
             ) as cursor:
                 rows = await cursor.fetchall()
@@ -335,13 +475,44 @@ class DatabaseService:
         status = 1 if approved else -1
 
         async with self.get_connection() as conn:
-            await conn.execute(
-                "UPDATE approvals SET approved = ? WHERE run_id = ? AND command_hash = ?",
+            async with conn.execute(
+                "UPDATE approvals SET approved = ? WHERE run_id = ? AND command_hash = ? "
+                f"RETURNING {_APPROVAL_COLUMNS}",
                 (status, run_id, command_hash),
-            )
+            ) as cursor:
+                row = await cursor.fetchone()
             await conn.commit()
+            return Approval(**dict(row)) if row else None
+
+    # --- Search Cache Operations ---
+
+    async def get_cached_search(self, key: str, max_age: float) -> Optional[str]:
+        """
+        Get a cached search result.
+
+        Args:
+            key: Cache key of the search
+            max_age: Maximum entry age in seconds
+
+        Returns:
+            The cached result, or None if missing or expired
+        """
+        async with self.get_connection() as conn:
+            async with conn.execute(
+                "SELECT result FROM search_cache WHERE key = ? AND created_at >= ?",
+                (key, time.time() - max_age),
+            ) as cursor:
+                row = await cursor.fetchone()
+        return row["result"] if row else None
 
-        return await self.get_approval(run_id, command_hash)
+    async def set_cached_search(self, key: str, result: str) -> None:
+        """Store (or refresh) a search result in the cache."""
+        async with self.get_connection() as conn:
+            await conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, result, created_at) VALUES (?, ?, ?)",
+                (key, result, time.time()),
+            )
+            await conn.commit()
 
 
 # Global instance
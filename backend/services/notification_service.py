@@ -61,6 +61,23 @@ class NotificationService:
             ),
         )
 
+    async def notify_message_delta(
+        self,
+        run_id: str,
+        delta: str,
+        name: Optional[str] = None,
+    ) -> None:
+        """Notify clients of the next chunk of an assistant message being streamed."""
+        await self.manager.broadcast(
+            run_id,
+            create_ws_event(
+                WSEventType.MESSAGE_DELTA,
+                role="assistant",
+                delta=delta,
+                name=name,
+            ),
+        )
+
     async def notify_tool_call(
         self,
         run_id: str,
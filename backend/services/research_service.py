@@ -6,17 +6,30 @@ Manages the lifecycle of research runs including start, pause, resume.
 
 import asyncio
 import logging
+import re
+import uuid
 from typing import Any, Dict, Optional, Set
 
 from backend.agents.graph import create_research_graph
 from backend.agents.state import ResearchState, create_initial_state
+from backend.api.websocket import message_fields
 from backend.core.checkpointer import get_checkpointer, get_thread_config
 from backend.core.llm import get_llm_provider
 from backend.persistence.database import get_db_service
+from backend.persistence.models import Run
 from backend.services.notification_service import get_notification_service
 
 logger = logging.getLogger(__name__)
 
+# "approve: ..." / "reject: ..." replies to the plan confirmation (any case)
+_PLAN_REPLY_RE = re.compile(r"(approve|reject):(.*)", re.IGNORECASE | re.DOTALL)
+
+# Nodes whose output marks the start of a plan step
+_STEP_START_NODES = frozenset({"identify_themes", "theme_identifier"})
+
+# Nodes whose search_themes output is always announced to the client
+_SEARCH_NOTIFY_NODES = frozenset({"theme_identifier", "search_dispatcher"})
+
 
 class ResearchService:
     """
@@ -32,6 +45,12 @@ class ResearchService:
         self._graph = None
         # Track tokens per run for aggregation
         self._run_tokens: Dict[str, int] = {}
+        # Tokens not yet written to the database, flushed once per graph event
+        self._pending_tokens: Dict[str, int] = {}
+        # Ids of messages already pushed to clients, per execution. The
+        # executor subgraph shares the parent state schema, so its final
+        # update echoes the whole message list back through the stream.
+        self._notified_messages: Dict[str, Set[str]] = {}
 
     async def _get_graph(self):
         """Get or create the compiled research graph."""
@@ -51,11 +70,11 @@ class ResearchService:
             return
 
         try:
-            db = await get_db_service()
             notification = get_notification_service()
 
-            # Update database
-            await db.increment_tokens(run_id, total_new)
+            # Defer the database write; parallel workers would otherwise
+            # commit once per LLM call
+            self._pending_tokens[run_id] = self._pending_tokens.get(run_id, 0) + total_new
 
             # Track cumulative tokens for this run
             self._run_tokens[run_id] = self._run_tokens.get(run_id, 0) + total_new
@@ -68,10 +87,28 @@ class ResearchService:
                 self._run_tokens[run_id],
             )
 
-            logger.debug(f"Token update for run {run_id}: +{total_new} (total: {self._run_tokens[run_id]})")
+            logger.debug("Token update for run %s: +%d (total: %d)", run_id, total_new, self._run_tokens[run_id])
         except Exception as e:
             logger.warning(f"Failed to track tokens for run {run_id}: {e}")
 
+    def _seed_notified_messages(self, run_id: str, values: Dict[str, Any]) -> None:
+        """Mark messages already in the checkpoint as delivered before resuming."""
+        self._notified_messages[run_id] = {
+            msg.id for msg in values.get("messages", []) if getattr(msg, "id", None)
+        }
+
+    async def _flush_tokens(self, run_id: str) -> None:
+        """Write the run's accumulated token usage in a single update."""
+        pending = self._pending_tokens.pop(run_id, 0)
+        if not pending:
+            return
+
+        try:
+            db = await get_db_service()
+            await db.increment_tokens(run_id, pending)
+        except Exception as e:
+            logger.warning(f"Failed to persist tokens for run {run_id}: {e}")
+
     async def is_running(self, run_id: str) -> bool:
         """
         Check if a run is currently executing.
@@ -146,9 +183,7 @@ class ResearchService:
                 # If awaiting confirmation, send the plan confirmation event
                 if phase == "awaiting_confirmation":
                     plan = final_state.values.get("plan", [])
-                    # Convert PlanStep TypedDicts to regular dicts for JSON serialization
-                    plan_dicts = [dict(step) for step in plan]
-                    await notification.notify_plan_confirmation_needed(run_id, plan_dicts)
+                    await notification.notify_plan_confirmation_needed(run_id, plan)
                     await db.update_run(run_id, status="awaiting_confirmation")
 
                 # If awaiting terminal approval (future feature)
@@ -175,7 +210,9 @@ class ResearchService:
 
         finally:
             # Clean up token tracking
+            await self._flush_tokens(run_id)
             llm_provider.clear_token_callback()
+            self._notified_messages.pop(run_id, None)
 
     async def _process_graph_event(
         self,
@@ -184,6 +221,7 @@ class ResearchService:
     ) -> None:
         """Process a graph stream event and send notifications."""
         notification = get_notification_service()
+        await self._flush_tokens(run_id)
 
         for node_name, node_output in event.items():
             if not isinstance(node_output, dict):
@@ -192,9 +230,7 @@ class ResearchService:
             # Notify plan updates
             if "plan" in node_output:
                 plan = node_output["plan"]
-                # Convert TypedDicts to regular dicts if needed
-                plan_dicts = [dict(step) if hasattr(step, "_asdict") else dict(step) for step in plan]
-                await notification.notify_plan_update(run_id, plan_dicts)
+                await notification.notify_plan_update(run_id, plan)
 
             # Notify phase changes
 
@@ -214,7 +250,7 @@ class ResearchService:
                     )
 
             # Notify step starts
-            if node_name in ["identify_themes", "theme_identifier"]:
+            if node_name in _STEP_START_NODES:
                 plan = node_output.get("plan", [])
                 idx = node_output.get("current_step_index", 0)
                 if idx < len(plan):
@@ -227,44 +263,43 @@ class ResearchService:
             # Notify parallel searches
             # Only notify if we have themes AND we are in the searching phase (search_dispatcher)
             # OR if it's the theme_identifier (initial identification)
-            if "search_themes" in node_output and node_output["search_themes"]:
-                should_notify = False
-                if node_name == "theme_identifier":
-                    should_notify = True
-                elif node_name == "search_dispatcher":
-                    should_notify = True
-                elif node_output.get("phase") == "searching":
-                    should_notify = True
-                
-                if should_notify:
-                    await notification.notify_search_parallel(
-                        run_id,
-                        node_output["search_themes"],
-                    )
+            if node_output.get("search_themes") and (
+                node_name in _SEARCH_NOTIFY_NODES or node_output.get("phase") == "searching"
+            ):
+                await notification.notify_search_parallel(
+                    run_id,
+                    node_output["search_themes"],
+                )
 
-            # Handle executor subgraph events
-            if "executor_decision" in node_output:
+            # Handle executor subgraph events (only logged, skip when DEBUG is off)
+            if "executor_decision" in node_output and logger.isEnabledFor(logging.DEBUG):
                 decision = node_output["executor_decision"]
                 if decision:
                     tool = decision.get("decision", "")
                     if tool and tool != "DONE":
-                        logger.debug(f"Executor using tool: {tool}")
+                        logger.debug("Executor using tool: %s", tool)
 
             # Handle pending terminal commands (for future approval flow)
             if "pending_terminal" in node_output and node_output["pending_terminal"]:
                 pending = node_output["pending_terminal"]
-                logger.info(f"Terminal command pending: {pending.get('command', '')[:50]}...")
+                logger.info("Terminal command pending: %.50s...", pending.get("command", ""))
 
             # Notify messages
             if "messages" in node_output:
+                notified = self._notified_messages.setdefault(run_id, set())
                 for msg in node_output["messages"]:
-                    if hasattr(msg, "content"):
-                        await notification.notify_message(
-                            run_id,
-                            getattr(msg, "type", "unknown"),
-                            msg.content,
-                            getattr(msg, "name", None),
-                        )
+                    fields = message_fields(msg)
+                    if fields is None:
+                        continue
+                    # New node output may not have been through add_messages
+                    # yet; it keeps an id that is already set, so the one
+                    # assigned here is the id the message gets in state
+                    if msg.id is None:
+                        msg.id = str(uuid.uuid4())
+                    elif msg.id in notified:
+                        continue
+                    notified.add(msg.id)
+                    await notification.notify_message(run_id, *fields)
 
     async def pause_research(self, run_id: str) -> None:
         """Request pause for a running research."""
@@ -275,9 +310,17 @@ class ResearchService:
         self,
         run_id: str,
         user_input: str,
+        run: Optional[Run] = None,
     ) -> None:
-        """Resume a paused research with user input."""
-        logger.info(f"Resuming run {run_id} with input: {user_input[:50]}...")
+        """
+        Resume a paused research with user input.
+
+        Args:
+            run_id: Run to resume
+            user_input: Message from the user
+            run: Already-loaded run record, to skip the database lookup
+        """
+        logger.info("Resuming run %s with input: %.50s...", run_id, user_input)
 
         notification = get_notification_service()
         db = await get_db_service()
@@ -285,16 +328,15 @@ class ResearchService:
         # Setup token tracking (resume with existing count)
         llm_provider = get_llm_provider()
         llm_provider.set_token_callback(run_id, self._on_tokens)
-        # Load existing token count from database
-        run = await db.get_run(run_id)
+        # Load the run once: existing token count and owner for the thread config
+        if run is None:
+            run = await db.get_run(run_id)
         if run:
             self._run_tokens[run_id] = run.total_tokens
 
         try:
             graph = await self._get_graph()
 
-            # Get current state
-            run = await db.get_run(run_id)
             if not run:
                 logger.error(f"Run not found: {run_id}")
                 return
@@ -305,13 +347,17 @@ class ResearchService:
             if not current_state or not current_state.values:
                 logger.error(f"No state found for run {run_id}")
                 return
+            self._seed_notified_messages(run_id, current_state.values)
 
-            # Check if this is a plan rejection - need to re-plan
-            is_rejection = user_input.lower().startswith("reject:")
+            # Classify the reply with a single match instead of lowercasing the
+            # input for each prefix check
+            reply = _PLAN_REPLY_RE.match(user_input)
+            verdict = reply.group(1).lower() if reply else None
 
-            if is_rejection:
+            # Check if this is a plan rejection - need to re-plan
+            if verdict == "reject":
                 # Extract feedback from rejection
-                feedback = user_input[7:].strip()  # Remove "reject:" prefix
+                feedback = reply.group(2).strip()
                 logger.info(f"Plan rejected for run {run_id}, feedback: {feedback}")
 
                 # Update state with feedback and set replan flag
@@ -337,8 +383,8 @@ class ResearchService:
                 # Normal approval - just update user_response
                 # Strip "approve:" prefix if present
                 response = user_input
-                if user_input.lower().startswith("approve:"):
-                    response = user_input[8:].strip()
+                if verdict == "approve":
+                    response = reply.group(2).strip()
                 elif user_input.lower() == "approve":
                     response = ""
 
@@ -368,8 +414,7 @@ class ResearchService:
                 phase = final_state.values.get("phase", "")
                 if phase == "awaiting_confirmation":
                     plan = final_state.values.get("plan", [])
-                    plan_dicts = [dict(step) for step in plan]
-                    await notification.notify_plan_confirmation_needed(run_id, plan_dicts)
+                    await notification.notify_plan_confirmation_needed(run_id, plan)
                     await db.update_run(run_id, status="awaiting_confirmation")
                 elif phase == "awaiting_terminal":
                     pending = final_state.values.get("pending_terminal", {})
@@ -388,14 +433,20 @@ class ResearchService:
             await notification.notify_run_error(run_id, str(e))
 
         finally:
+            await self._flush_tokens(run_id)
             llm_provider.clear_token_callback()
+            self._notified_messages.pop(run_id, None)
 
-    async def resume_interrupted(self, run_id: str) -> None:
+    async def resume_interrupted(self, run_id: str, run: Optional[Run] = None) -> None:
         """
         Resume an interrupted research run from its last checkpoint.
 
         This is used when a run was interrupted by server crash/restart.
         It continues execution from where it left off without modifying state.
+
+        Args:
+            run_id: Run to resume
+            run: Already-loaded run record, to skip the database lookup
         """
         logger.info(f"Resuming interrupted run {run_id}")
 
@@ -407,7 +458,8 @@ class ResearchService:
         llm_provider.set_token_callback(run_id, self._on_tokens)
 
         # Load existing token count from database
-        run = await db.get_run(run_id)
+        if run is None:
+            run = await db.get_run(run_id)
         if not run:
             logger.error(f"Run not found: {run_id}")
             return
@@ -424,6 +476,7 @@ class ResearchService:
                 logger.error(f"No checkpoint found for interrupted run {run_id}")
                 await notification.notify_run_error(run_id, "No checkpoint found to resume from")
                 return
+            self._seed_notified_messages(run_id, current_state.values)
 
             # Update run status to active
             await db.update_run(run_id, status="active")
@@ -451,8 +504,7 @@ class ResearchService:
                 phase = final_state.values.get("phase", "")
                 if phase == "awaiting_confirmation":
                     plan = final_state.values.get("plan", [])
-                    plan_dicts = [dict(step) for step in plan]
-                    await notification.notify_plan_confirmation_needed(run_id, plan_dicts)
+                    await notification.notify_plan_confirmation_needed(run_id, plan)
                     await db.update_run(run_id, status="awaiting_confirmation")
                 elif phase == "awaiting_terminal":
                     await db.update_run(run_id, status="awaiting_terminal")
@@ -468,15 +520,26 @@ class ResearchService:
             await notification.notify_run_error(run_id, str(e))
 
         finally:
+            await self._flush_tokens(run_id)
             llm_provider.clear_token_callback()
+            self._notified_messages.pop(run_id, None)
+
+    async def get_state(
+        self, run_id: str, run: Optional[Run] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get current state for a run.
 
-    async def get_state(self, run_id: str) -> Optional[Dict[str, Any]]:
-        """Get current state for a run."""
+        Args:
+            run_id: Run to load
+            run: Already-loaded run record, to skip the database lookup
+        """
         try:
             graph = await self._get_graph()
-            db = await get_db_service()
 
-            run = await db.get_run(run_id)
+            if run is None:
+                db = await get_db_service()
+                run = await db.get_run(run_id)
             if not run:
                 return None
 
@@ -544,6 +607,7 @@ class ResearchService:
             if not pending:
                 logger.warning(f"No pending terminal for run {run_id}")
                 return
+            self._seed_notified_messages(run_id, current_state.values)
 
             if not approved:
                 # Terminal was denied - record as failed and continue
@@ -607,8 +671,7 @@ class ResearchService:
                 phase = final_state.values.get("phase", "")
                 if phase == "awaiting_confirmation":
                     plan = final_state.values.get("plan", [])
-                    plan_dicts = [dict(step) for step in plan]
-                    await notification.notify_plan_confirmation_needed(run_id, plan_dicts)
+                    await notification.notify_plan_confirmation_needed(run_id, plan)
                     await db.update_run(run_id, status="awaiting_confirmation")
                 elif phase == "awaiting_terminal":
                     await db.update_run(run_id, status="awaiting_terminal")
@@ -625,7 +688,9 @@ class ResearchService:
 
         finally:
             llm_provider = get_llm_provider()
+            await self._flush_tokens(run_id)
             llm_provider.clear_token_callback()
+            self._notified_messages.pop(run_id, None)
 
 
 # Global instance
@@ -12,6 +12,9 @@ export class WebSocketClient {
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000;
   private pingInterval: ReturnType<typeof setInterval> | null = null;
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  // Set by disconnect() so the close it triggers does not start a reconnect
+  private closed = false;
 
   constructor(runId: string) {
     this.runId = runId;
@@ -31,11 +34,8 @@ export class WebSocketClient {
       console.log('WebSocket connected');
       this.reconnectAttempts = 0;
       this.startPing();
-
-      // Request state sync on connect/reconnect
-      if (this.ws?.readyState === WebSocket.OPEN) {
-        this.ws.send(JSON.stringify({ type: 'request_state' }));
-      }
+      // No explicit request_state here: the server pushes a state_sync
+      // on every (re)connect, so asking again would load the state twice
     };
 
     this.ws.onmessage = (event) => {
@@ -50,7 +50,9 @@ export class WebSocketClient {
     this.ws.onclose = () => {
       console.log('WebSocket disconnected');
       this.stopPing();
-      this.attemptReconnect();
+      if (!this.closed) {
+        this.attemptReconnect();
+      }
     };
 
     this.ws.onerror = (error) => {
@@ -84,12 +86,18 @@ export class WebSocketClient {
 
     console.log(`Reconnecting in ${delay}ms (attempt ${this.reconnectAttempts})`);
 
-    setTimeout(() => {
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
       this.connect();
     }, delay);
   }
 
   disconnect(): void {
+    this.closed = true;
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
     this.stopPing();
     if (this.ws) {
       this.ws.close();
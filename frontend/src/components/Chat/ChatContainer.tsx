@@ -180,7 +180,7 @@ export default function ChatContainer({
             </div>
           </div>
         ) : (
-          <MessageList messages={messages} />
+          <MessageList messages={messages} runId={currentRun?.id} />
         )}
         <div ref={messagesEndRef} />
       </div>
@@ -0,0 +1,30 @@
+// @vitest-environment jsdom
+import { describe, expect, it } from 'vitest';
+import { fireEvent, render, screen } from '@testing-library/react';
+import MessageList from './MessageList';
+import { Message } from '../../types';
+
+function history(count: number): Message[] {
+  return Array.from({ length: count }, (_, i) => ({
+    role: 'assistant',
+    content: `message ${i}`,
+  }));
+}
+
+function renderedCount(): number {
+  return screen.getAllByText(/^message \d+$/).length;
+}
+
+describe('MessageList', () => {
+  it('resets the expanded page when the run changes', () => {
+    const messages = history(120);
+    const { rerender } = render(<MessageList messages={messages} runId="run-a" />);
+    expect(renderedCount()).toBe(50);
+
+    fireEvent.click(screen.getByText('Show 50 earlier messages'));
+    expect(renderedCount()).toBe(100);
+
+    rerender(<MessageList messages={messages} runId="run-b" />);
+    expect(renderedCount()).toBe(50);
+  });
+});
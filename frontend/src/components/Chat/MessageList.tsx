@@ -1,11 +1,17 @@
+import { memo, useState } from 'react';
 import { Message } from '../../types';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
 import { clsx } from 'clsx';
 import { User, Bot, Wrench } from 'lucide-react';
 
+// Only the newest messages are rendered; older ones are revealed on demand
+const PAGE_SIZE = 50;
+
 interface MessageListProps {
   messages: Message[];
+  // Paging is per run: switching runs starts again from the newest page
+  runId?: string;
 }
 
 function getMessageIcon(role: Message['role']) {
@@ -34,50 +40,75 @@ function getMessageStyle(role: Message['role']) {
   }
 }
 
-export default function MessageList({ messages }: MessageListProps) {
+// Messages are immutable once received, so a memoized item skips the
+// markdown re-parse when the list re-renders for a new message or token update
+const MessageItem = memo(function MessageItem({ message }: { message: Message }) {
   return (
-    <div className="space-y-4">
-      {messages.map((message, index) => (
+    <div
+      className={clsx(
+        'rounded-lg border p-4',
+        getMessageStyle(message.role)
+      )}
+    >
+      <div className="flex items-start gap-3">
         <div
-          key={index}
           className={clsx(
-            'rounded-lg border p-4',
-            getMessageStyle(message.role)
+            'flex-shrink-0 w-8 h-8 rounded-full flex items-center justify-center',
+            message.role === 'user'
+              ? 'bg-primary-100 dark:bg-primary-900 text-primary-600 dark:text-primary-300'
+              : message.role === 'tool'
+              ? 'bg-slate-200 dark:bg-slate-700 text-slate-600 dark:text-slate-300'
+              : 'bg-slate-100 dark:bg-slate-700 text-slate-600 dark:text-slate-300'
           )}
         >
-          <div className="flex items-start gap-3">
-            <div
-              className={clsx(
-                'flex-shrink-0 w-8 h-8 rounded-full flex items-center justify-center',
-                message.role === 'user'
-                  ? 'bg-primary-100 dark:bg-primary-900 text-primary-600 dark:text-primary-300'
+          {getMessageIcon(message.role)}
+        </div>
+        <div className="flex-1 min-w-0">
+          <div className="flex items-center gap-2 mb-1">
+            <span className="text-sm font-medium text-slate-900 dark:text-slate-100">
+              {message.name ||
+                (message.role === 'user'
+                  ? 'You'
                   : message.role === 'tool'
-                  ? 'bg-slate-200 dark:bg-slate-700 text-slate-600 dark:text-slate-300'
-                  : 'bg-slate-100 dark:bg-slate-700 text-slate-600 dark:text-slate-300'
-              )}
-            >
-              {getMessageIcon(message.role)}
-            </div>
-            <div className="flex-1 min-w-0">
-              <div className="flex items-center gap-2 mb-1">
-                <span className="text-sm font-medium text-slate-900 dark:text-slate-100">
-                  {message.name ||
-                    (message.role === 'user'
-                      ? 'You'
-                      : message.role === 'tool'
-                      ? 'Tool'
-                      : 'Assistant')}
-                </span>
-                <span className="text-xs text-slate-400 dark:text-slate-500">
-                  {message.role}
-                </span>
-              </div>
-              <div className="prose prose-sm prose-slate dark:prose-invert max-w-none markdown-content">
-                <ReactMarkdown remarkPlugins={[remarkGfm]}>{message.content}</ReactMarkdown>
-              </div>
-            </div>
+                  ? 'Tool'
+                  : 'Assistant')}
+            </span>
+            <span className="text-xs text-slate-400 dark:text-slate-500">
+              {message.role}
+            </span>
+          </div>
+          <div className="prose prose-sm prose-slate dark:prose-invert max-w-none markdown-content">
+            <ReactMarkdown remarkPlugins={[remarkGfm]}>{message.content}</ReactMarkdown>
           </div>
         </div>
+      </div>
+    </div>
+  );
+});
+
+export default function MessageList({ messages, runId }: MessageListProps) {
+  // The expanded page belongs to the run it was opened for; on a run switch
+  // reset it during render so the new run never renders with a stale count
+  const [page, setPage] = useState({ runId, count: PAGE_SIZE });
+  if (page.runId !== runId) {
+    setPage({ runId, count: PAGE_SIZE });
+  }
+  const visibleCount = page.runId === runId ? page.count : PAGE_SIZE;
+  const start = Math.max(0, messages.length - visibleCount);
+  const visible = messages.slice(start);
+
+  return (
+    <div className="space-y-4">
+      {start > 0 && (
+        <button
+          onClick={() => setPage({ runId, count: visibleCount + PAGE_SIZE })}
+          className="w-full py-2 text-sm text-slate-500 dark:text-slate-400 hover:text-slate-700 dark:hover:text-slate-200"
+        >
+          Show {Math.min(start, PAGE_SIZE)} earlier messages
+        </button>
+      )}
+      {visible.map((message, index) => (
+        <MessageItem key={start + index} message={message} />
       ))}
     </div>
   );
@@ -2,6 +2,7 @@ import { useEffect, useState, useCallback } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../hooks/useAuth';
 import { useResearch } from '../hooks/useResearch';
+import { useShallow } from 'zustand/react/shallow';
 import { useResearchStore } from '../stores/researchStore';
 import Sidebar from './Sidebar/Sidebar';
 import ChatContainer from './Chat/ChatContainer';
@@ -41,7 +42,19 @@ export default function ResearchPage() {
     closePlanConfirmationModal,
     plan,
     currentRun,
-  } = useResearchStore();
+  } = useResearchStore(
+    useShallow((s) => ({
+      fetchRuns: s.fetchRuns,
+      runs: s.runs,
+      createRun: s.createRun,
+      showPlanConfirmationModal: s.showPlanConfirmationModal,
+      confirmPlan: s.confirmPlan,
+      rejectPlan: s.rejectPlan,
+      closePlanConfirmationModal: s.closePlanConfirmationModal,
+      plan: s.plan,
+      currentRun: s.currentRun,
+    }))
+  );
   const research = useResearch(runId || null);
 
   const [sidebarWidth, setSidebarWidth] = useState(getSavedWidth);
@@ -59,24 +72,37 @@ export default function ResearchPage() {
   useEffect(() => {
     if (!isResizing) return;
 
+    // mousemove fires far more often than the screen refreshes; apply at most
+    // one width update per animation frame to avoid a re-render storm
+    let frame = 0;
+    let latestWidth = sidebarWidth;
+
     const handleMouseMove = (e: MouseEvent) => {
-      const newWidth = Math.min(MAX_SIDEBAR_WIDTH, Math.max(MIN_SIDEBAR_WIDTH, e.clientX));
-      setSidebarWidth(newWidth);
+      latestWidth = Math.min(MAX_SIDEBAR_WIDTH, Math.max(MIN_SIDEBAR_WIDTH, e.clientX));
+      if (!frame) {
+        frame = requestAnimationFrame(() => {
+          frame = 0;
+          setSidebarWidth(latestWidth);
+        });
+      }
     };
 
     const handleMouseUp = () => {
+      setSidebarWidth(latestWidth);
       setIsResizing(false);
-      localStorage.setItem(SIDEBAR_WIDTH_KEY, sidebarWidth.toString());
+      localStorage.setItem(SIDEBAR_WIDTH_KEY, latestWidth.toString());
     };
 
     document.addEventListener('mousemove', handleMouseMove);
     document.addEventListener('mouseup', handleMouseUp);
 
     return () => {
+      cancelAnimationFrame(frame);
       document.removeEventListener('mousemove', handleMouseMove);
       document.removeEventListener('mouseup', handleMouseUp);
     };
-  }, [isResizing, sidebarWidth]);
+    // Listeners track the width locally, so they are attached once per drag
+  }, [isResizing]);
 
   const handleCreateRun = async () => {
     const baseName = "New Chat";
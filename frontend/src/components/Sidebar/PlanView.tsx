@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import { PlanStep } from '../../types';
 import { clsx } from 'clsx';
 import { CheckCircle, Circle, AlertCircle, Loader2, MinusCircle } from 'lucide-react';
@@ -8,44 +9,35 @@ interface PlanViewProps {
   phase: string;
 }
 
+// Static per-status icons and row styles, built once instead of per render
+const STEP_ICONS: Partial<Record<PlanStep['status'], JSX.Element>> = {
+  DONE: <CheckCircle className="w-4 h-4 text-green-500" />,
+  IN_PROGRESS: <Loader2 className="w-4 h-4 text-primary-500 animate-spin" />,
+  FAILED: <AlertCircle className="w-4 h-4 text-red-500" />,
+  SKIPPED: <MinusCircle className="w-4 h-4 text-slate-400 dark:text-slate-500" />,
+};
+
+const CURRENT_STEP_ICON = <Circle className="w-4 h-4 text-primary-500" />;
+const PENDING_STEP_ICON = <Circle className="w-4 h-4 text-slate-300 dark:text-slate-600" />;
+
+const STEP_BG_COLORS: Partial<Record<PlanStep['status'], string>> = {
+  DONE: 'bg-green-50 dark:bg-green-900/10 border-green-200 dark:border-green-800',
+  IN_PROGRESS: 'bg-primary-50 dark:bg-primary-900/10 border-primary-200 dark:border-primary-800',
+  FAILED: 'bg-red-50 dark:bg-red-900/10 border-red-200 dark:border-red-800',
+  SKIPPED: 'bg-slate-50 dark:bg-slate-800 border-slate-200 dark:border-slate-700',
+};
+
+const DEFAULT_STEP_BG = 'bg-white dark:bg-slate-900 border-slate-200 dark:border-slate-700';
+
 function getStepIcon(step: PlanStep, isCurrent: boolean) {
-  switch (step.status) {
-    case 'DONE':
-      return <CheckCircle className="w-4 h-4 text-green-500" />;
-    case 'IN_PROGRESS':
-      return <Loader2 className="w-4 h-4 text-primary-500 animate-spin" />;
-    case 'FAILED':
-      return <AlertCircle className="w-4 h-4 text-red-500" />;
-    case 'SKIPPED':
-      return <MinusCircle className="w-4 h-4 text-slate-400 dark:text-slate-500" />;
-    default:
-      return (
-        <Circle
-          className={clsx(
-            'w-4 h-4',
-            isCurrent ? 'text-primary-500' : 'text-slate-300 dark:text-slate-600'
-          )}
-        />
-      );
-  }
+  return STEP_ICONS[step.status] ?? (isCurrent ? CURRENT_STEP_ICON : PENDING_STEP_ICON);
 }
 
 function getStepBgColor(step: PlanStep): string {
-  switch (step.status) {
-    case 'DONE':
-      return 'bg-green-50 dark:bg-green-900/10 border-green-200 dark:border-green-800';
-    case 'IN_PROGRESS':
-      return 'bg-primary-50 dark:bg-primary-900/10 border-primary-200 dark:border-primary-800';
-    case 'FAILED':
-      return 'bg-red-50 dark:bg-red-900/10 border-red-200 dark:border-red-800';
-    case 'SKIPPED':
-      return 'bg-slate-50 dark:bg-slate-800 border-slate-200 dark:border-slate-700';
-    default:
-      return 'bg-white dark:bg-slate-900 border-slate-200 dark:border-slate-700';
-  }
+  return STEP_BG_COLORS[step.status] ?? DEFAULT_STEP_BG;
 }
 
-export default function PlanView({ plan, currentStepIndex, phase }: PlanViewProps) {
+function PlanView({ plan, currentStepIndex, phase }: PlanViewProps) {
   const completedCount = plan.filter(
     (s) => s.status === 'DONE' || s.status === 'SKIPPED'
   ).length;
@@ -127,3 +119,7 @@ export default function PlanView({ plan, currentStepIndex, phase }: PlanViewProp
     </div>
   );
 }
+
+// The sidebar re-renders on every store change (messages, token counts);
+// the plan only needs to when its own props change
+export default memo(PlanView);
@@ -1,20 +1,36 @@
-import { useCallback, useEffect } from 'react';
+import { useEffect } from 'react';
+import { useShallow } from 'zustand/react/shallow';
 import { useResearchStore } from '../stores/researchStore';
 import { useWebSocket } from './useWebSocket';
 
 export function useResearch(runId: string | null) {
-  const store = useResearchStore();
-
-  // Handle WebSocket events
-  const handleWSEvent = useCallback(
-    (event: Parameters<typeof store.handleWSEvent>[0]) => {
-      store.handleWSEvent(event);
-    },
-    [store]
+  // Shallow-compared selection: set() calls that leave these fields as they
+  // were do not re-render the caller
+  const store = useResearchStore(
+    useShallow((s) => ({
+      currentRun: s.currentRun,
+      phase: s.phase,
+      plan: s.plan,
+      currentStepIndex: s.currentStepIndex,
+      messages: s.messages,
+      isRunning: s.isRunning,
+      searchThemes: s.searchThemes,
+      pendingApprovals: s.pendingApprovals,
+      isLoading: s.isLoading,
+      error: s.error,
+      startResearch: s.startResearch,
+      pauseResearch: s.pauseResearch,
+      resumeResearch: s.resumeResearch,
+      sendMessage: s.sendMessage,
+      respondToApproval: s.respondToApproval,
+      clearError: s.clearError,
+      selectRun: s.selectRun,
+      handleWSEvent: s.handleWSEvent,
+    }))
   );
 
-  // Connect WebSocket
-  useWebSocket(runId, handleWSEvent);
+  // Connect WebSocket (store actions are stable, no wrapper needed)
+  useWebSocket(runId, store.handleWSEvent);
 
   // Load run when selected
   useEffect(() => {
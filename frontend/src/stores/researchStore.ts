@@ -106,20 +106,23 @@ export const useResearchStore = create<ResearchState>((set, get) => ({
   },
 
   selectRun: async (runId: string) => {
-    set({ isLoading: true });
+    // Research state (phase, plan, messages) arrives via the state_sync the
+    // server pushes when the run's WebSocket connects, so only the run
+    // metadata is fetched here. Clear the previous run's state right away so
+    // it is never shown under the new run while the sync is in flight.
+    set((state) => ({
+      isLoading: true,
+      currentRun: state.runs.find((r) => r.id === runId) ?? null,
+      phase: 'idle',
+      plan: [],
+      currentStepIndex: 0,
+      messages: [],
+      isRunning: false,
+      searchThemes: [],
+    }));
     try {
       const run = await runsApi.get(runId);
-      const state = await researchApi.getState(runId);
-
-      set({
-        currentRun: run,
-        phase: state.phase || 'idle',
-        plan: state.plan || [],
-        currentStepIndex: state.current_step_index || 0,
-        messages: state.messages || [],
-        isRunning: state.is_running || false,
-        isLoading: false,
-      });
+      set({ currentRun: run, isLoading: false });
     } catch (error) {
       set({ error: 'Failed to load run', isLoading: false });
     }
@@ -278,16 +281,41 @@ export const useResearchStore = create<ResearchState>((set, get) => ({
         break;
 
       case 'message':
-        set((state) => ({
-          messages: [
-            ...state.messages,
-            {
-              role: event.role as Message['role'],
-              content: event.content as string,
-              name: event.name as string | undefined,
-            },
-          ],
-        }));
+        set((state) => {
+          const message: Message = {
+            role: event.role as Message['role'],
+            content: event.content as string,
+            name: event.name as string | undefined,
+          };
+          // The final message replaces its streamed preview
+          const last = state.messages[state.messages.length - 1];
+          if (last?.streaming && last.name === message.name) {
+            return { messages: [...state.messages.slice(0, -1), message] };
+          }
+          return { messages: [...state.messages, message] };
+        });
+        break;
+
+      case 'message_delta':
+        set((state) => {
+          const delta = event.delta as string;
+          const name = event.name as string | undefined;
+          const last = state.messages[state.messages.length - 1];
+          if (last?.streaming && last.name === name) {
+            return {
+              messages: [
+                ...state.messages.slice(0, -1),
+                { ...last, content: last.content + delta },
+              ],
+            };
+          }
+          return {
+            messages: [
+              ...state.messages,
+              { role: event.role as Message['role'], content: delta, name, streaming: true },
+            ],
+          };
+        });
         break;
 
       case 'plan_update':
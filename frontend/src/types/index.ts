@@ -53,6 +53,8 @@ export interface Message {
   content: string;
   name?: string;
   tool_calls?: ToolCall[];
+  // Set while the message is still being streamed via message_delta events
+  streaming?: boolean;
 }
 
 export interface ToolCall {
@@ -1,7 +1,16 @@
 """Tests for FastAPI endpoints."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import AsyncClient
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.api.dependencies import get_current_user
+from backend.main import app
+from backend.persistence.database import get_db_service
+from backend.services import research_service
 
 
 class TestHealthEndpoint:
@@ -87,6 +96,58 @@ class TestResearchEndpoints:
         assert response.status_code == 401
 
 
+@pytest.fixture
+def research_state(monkeypatch):
+    """Serve a five-message checkpoint for an authorized run."""
+    messages = [
+        HumanMessage(content=f"message {i}", id=f"m{i}")
+        if i % 2 == 0
+        else AIMessage(content=f"message {i}", id=f"m{i}")
+        for i in range(5)
+    ]
+    state = {"phase": "executing", "plan": [], "current_step_index": 0, "messages": messages}
+
+    db = SimpleNamespace(
+        get_run=AsyncMock(return_value=SimpleNamespace(user_id="user-1", status="active"))
+    )
+    service = SimpleNamespace(get_state=AsyncMock(return_value=state))
+
+    async def get_service():
+        return service
+
+    monkeypatch.setattr(research_service, "get_research_service", get_service)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="user-1")
+    app.dependency_overrides[get_db_service] = lambda: db
+    yield messages
+    app.dependency_overrides.clear()
+
+
+class TestResearchStateEndpoint:
+    """Tests for paging messages through the research state endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_newest(self, client: AsyncClient, research_state):
+        """Test that limit returns only the newest messages."""
+        response = await client.get("/research/state/run-1", params={"limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["content"] for m in data["messages"]] == ["message 3", "message 4"]
+
+    @pytest.mark.asyncio
+    async def test_since_beyond_end(self, client: AsyncClient, research_state):
+        """Test that a since past the end returns no messages."""
+        response = await client.get("/research/state/run-1", params={"since": 10})
+        assert response.status_code == 200
+        assert response.json()["messages"] == []
+
+    @pytest.mark.asyncio
+    async def test_message_count_is_full_length(self, client: AsyncClient, research_state):
+        """Test that message_count reports the whole history regardless of paging."""
+        for params in ({}, {"limit": 1}, {"since": 3}, {"since": 10}):
+            response = await client.get("/research/state/run-1", params=params)
+            assert response.json()["message_count"] == len(research_state)
+
+
 class TestApprovalsEndpoints:
     """Tests for approval endpoints."""
 
@@ -0,0 +1,87 @@
+"""Tests for the file reader tool node."""
+
+import pytest
+
+from backend.agents.executor.nodes.tools.file_reader import _parse_file_path, file_reader_node
+from backend.core.config import config
+
+
+async def _read(path, **params) -> dict:
+    """Run the node for a path and return its tool call record."""
+    state = {
+        "run_id": "run-1",
+        "executor_decision": {"params": {"path": str(path), **params}},
+        "executor_tool_history": [],
+    }
+    result = await file_reader_node(state)
+    return result["executor_tool_history"]
+
+
+@pytest.fixture
+def three_lines(tmp_path):
+    """A three-line text file."""
+    path = tmp_path / "notes.txt"
+    path.write_text("one\ntwo\nthree\n")
+    return path
+
+
+class TestParseFilePath:
+    """Tests for _parse_file_path."""
+
+    def test_line_range(self):
+        """Test path:start-end and path:line suffixes."""
+        assert _parse_file_path("/a/b.py:10-50") == ("/a/b.py", 10, 50)
+        assert _parse_file_path("/a/b.py:7") == ("/a/b.py", 7, 7)
+
+    def test_colon_without_range(self):
+        """Test that a ':' that is not a line range stays part of the path."""
+        assert _parse_file_path("/a/b.py") == ("/a/b.py", None, None)
+        assert _parse_file_path("C:/data/notes.txt") == ("C:/data/notes.txt", None, None)
+        assert _parse_file_path("/a/draft:v2.txt") == ("/a/draft:v2.txt", None, None)
+
+
+class TestFileReaderNode:
+    """Tests for file_reader_node line ranges and truncation."""
+
+    @pytest.mark.asyncio
+    async def test_range_at_file_bounds(self, three_lines):
+        """Test a range covering exactly the first to the last line."""
+        call = await _read(f"{three_lines}:1-3")
+        assert call["success"]
+        assert call["result"] == "   1 | one\n   2 | two\n   3 | three"
+
+    @pytest.mark.asyncio
+    async def test_end_past_eof(self, three_lines):
+        """Test that an end line past EOF stops at the last line."""
+        call = await _read(three_lines, start_line=2, end_line=100)
+        assert call["success"]
+        assert call["result"] == "   2 | two\n   3 | three"
+
+    @pytest.mark.asyncio
+    async def test_colon_in_path_reads_whole_file(self, tmp_path):
+        """Test that a file name containing ':' is read in full."""
+        path = tmp_path / "draft:v2.txt"
+        path.write_text("content\n")
+        call = await _read(path)
+        assert call["success"]
+        assert call["result"] == "content\n"
+
+    @pytest.mark.asyncio
+    async def test_exactly_max_chars_not_truncated(self, tmp_path, monkeypatch):
+        """Test that a file of exactly max_chars is returned as is."""
+        monkeypatch.setattr(config.research, "max_file_read_chars", 10)
+        path = tmp_path / "exact.txt"
+        path.write_text("x" * 10)
+        call = await _read(path)
+        assert call["result"] == "x" * 10
+
+    @pytest.mark.asyncio
+    async def test_one_over_max_chars_truncated(self, tmp_path, monkeypatch):
+        """Test that one character over max_chars is truncated with a notice."""
+        monkeypatch.setattr(config.research, "max_file_read_chars", 10)
+        path = tmp_path / "over.txt"
+        path.write_text("x" * 11)
+        call = await _read(path)
+        assert call["result"] == (
+            "x" * 10 + "\n\n... (truncated, showing first 10 chars of file)"
+        )
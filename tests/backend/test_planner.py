@@ -0,0 +1,31 @@
+"""Tests for planner response parsing."""
+
+from backend.agents.planner.node import parse_plan_steps
+
+
+class TestParsePlanSteps:
+    """Tests for parse_plan_steps."""
+
+    def test_numbered_formats(self):
+        """Test numbered steps with '.', ')' and ':' separators."""
+        content = "1. First step\n2) Second step\n3: Third step"
+        assert parse_plan_steps(content) == ["First step", "Second step", "Third step"]
+
+    def test_bullet_formats(self):
+        """Test '-' and '*' bulleted steps."""
+        assert parse_plan_steps("- First\n* Second") == ["First", "Second"]
+
+    def test_skips_prose_and_empty_steps(self):
+        """Test that non-step lines and steps without text are ignored."""
+        content = "Here is the plan:\n\n1. Real step\n2.\n3.   \nThat's all."
+        assert parse_plan_steps(content) == ["Real step"]
+
+    def test_strips_surrounding_whitespace(self):
+        """Test indentation, trailing spaces and CRLF line endings."""
+        content = "  1. Indented  \r\n\t2) Tabbed\r\n"
+        assert parse_plan_steps(content) == ["Indented", "Tabbed"]
+
+    def test_unicode_and_control_whitespace(self):
+        """Test whitespace that str.strip() removes but is not a space or tab."""
+        content = "1.\u00a0non-breaking\n\u00a02. leading nbsp\n3.\x0cform feed"
+        assert parse_plan_steps(content) == ["non-breaking", "leading nbsp", "form feed"]
@@ -0,0 +1,96 @@
+"""Tests for live message notification in the research service."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.services import research_service
+from backend.services.research_service import ResearchService
+
+
+@pytest.fixture
+def notification(monkeypatch) -> AsyncMock:
+    """Replace the notification service with a recording stub."""
+    stub = AsyncMock()
+    monkeypatch.setattr(research_service, "get_notification_service", lambda: stub)
+    return stub
+
+
+def _sent(notification: AsyncMock) -> list:
+    """Contents pushed through notify_message, in order."""
+    return [call.args[2] for call in notification.notify_message.await_args_list]
+
+
+class TestMessageNotifications:
+    """Tests for message dedup across graph events and resumes."""
+
+    @pytest.mark.asyncio
+    async def test_echo_after_resume_not_resent(self, notification):
+        """Test that messages already in the checkpoint are not re-sent on resume."""
+        service = ResearchService()
+        service._seed_notified_messages(
+            "run-1", {"messages": [HumanMessage(content="query", id="m1")]}
+        )
+
+        event = {
+            "executor": {
+                "messages": [
+                    HumanMessage(content="query", id="m1"),
+                    AIMessage(content="finding", id="m2"),
+                ]
+            }
+        }
+        await service._process_graph_event("run-1", event)
+        await service._process_graph_event("run-1", event)
+
+        assert _sent(notification) == ["finding"]
+
+    @pytest.mark.asyncio
+    async def test_message_without_id_gets_one_once(self, notification):
+        """Test that an id-less message is assigned an id once and sent once."""
+        service = ResearchService()
+        message = HumanMessage(content="query")
+
+        await service._process_graph_event("run-1", {"planner": {"messages": [message]}})
+        assigned = message.id
+        await service._process_graph_event("run-1", {"executor": {"messages": [message]}})
+
+        assert assigned is not None
+        assert message.id == assigned
+        assert _sent(notification) == ["query"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_with_new_id_is_sent(self, notification):
+        """Test that the same text re-emitted as a new message is not dropped."""
+        service = ResearchService()
+
+        await service._process_graph_event(
+            "run-1", {"planner": {"messages": [HumanMessage(content="query")]}}
+        )
+        await service._process_graph_event(
+            "run-1", {"planner": {"messages": [HumanMessage(content="query")]}}
+        )
+
+        assert _sent(notification) == ["query", "query"]
+
+    @pytest.mark.asyncio
+    async def test_seen_set_dropped_when_run_ends(self, notification, monkeypatch):
+        """Test that the per-run set is released once execution finishes."""
+        monkeypatch.setattr(research_service, "get_db_service", AsyncMock(return_value=AsyncMock()))
+        monkeypatch.setattr(research_service, "get_llm_provider", lambda: MagicMock())
+
+        async def astream(*args, **kwargs):
+            yield (), {"planner": {"messages": [HumanMessage(content="query")]}}
+
+        graph = MagicMock()
+        graph.astream = astream
+        graph.aget_state = AsyncMock(return_value=SimpleNamespace(next=(), values={}))
+
+        service = ResearchService()
+        service._graph = graph
+        await service.execute_research("run-1", "user-1", "query")
+
+        assert _sent(notification) == ["query"]
+        assert "run-1" not in service._notified_messages
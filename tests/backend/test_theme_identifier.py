@@ -0,0 +1,35 @@
+"""Tests for search theme parsing."""
+
+from backend.agents.executor.nodes.search.theme_identifier import parse_search_themes
+
+
+class TestParseSearchThemes:
+    """Tests for parse_search_themes."""
+
+    def test_parses_queries(self):
+        """Test one query per SEARCH: line."""
+        content = "SEARCH: solar panel efficiency\nSEARCH: perovskite cells"
+        assert parse_search_themes(content) == ["solar panel efficiency", "perovskite cells"]
+
+    def test_duplicates_collapse_in_first_seen_order(self):
+        """Test that repeated queries are kept once, at their first position."""
+        content = "SEARCH: b\nSEARCH: a\nSEARCH: b\nSEARCH: c\nSEARCH: a"
+        assert parse_search_themes(content) == ["b", "a", "c"]
+
+    def test_lowercase_prefix(self):
+        """Test that the prefix is matched case-insensitively."""
+        assert parse_search_themes("search: lower\nSearch: mixed") == ["lower", "mixed"]
+
+    def test_whitespace_around_prefix(self):
+        """Test tabs and other non-newline whitespace around the prefix."""
+        content = "\tSEARCH:\ttabbed\n\u00a0SEARCH:\u00a0nbsp\r\n  SEARCH:\x0cform feed  "
+        assert parse_search_themes(content) == ["tabbed", "nbsp", "form feed"]
+
+    def test_empty_query_skipped(self):
+        """Test that a SEARCH: line without a query is ignored."""
+        assert parse_search_themes("SEARCH:\nSEARCH:   \nSEARCH: real") == ["real"]
+
+    def test_other_lines_ignored(self):
+        """Test that prose and lines not starting with SEARCH: are ignored."""
+        content = "Here are the queries:\nSEARCH: kept\nNote SEARCH: inline\n- SEARCH: bullet"
+        assert parse_search_themes(content) == ["kept"]
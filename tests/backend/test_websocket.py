@@ -0,0 +1,135 @@
+"""Tests for WebSocket message serialization."""
+
+from collections import OrderedDict
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.api import websocket
+from backend.api.websocket import serialize_messages, serialize_run_messages
+
+
+@pytest.fixture
+def serialize_calls(monkeypatch) -> list:
+    """Start from an empty cache and record the `since` of each conversion."""
+    monkeypatch.setattr(websocket, "_message_cache", OrderedDict())
+
+    calls = []
+    original = websocket.serialize_messages
+
+    def spy(messages, limit=None, since=0):
+        calls.append(since)
+        return original(messages, limit=limit, since=since)
+
+    monkeypatch.setattr(websocket, "serialize_messages", spy)
+    return calls
+
+
+def _history(count: int) -> list:
+    """Build an alternating user/assistant history with stable ids."""
+    return [
+        HumanMessage(content=f"message {i}", id=f"m{i}")
+        if i % 2 == 0
+        else AIMessage(content=f"message {i}", id=f"m{i}")
+        for i in range(count)
+    ]
+
+
+def _expected(messages: list) -> list:
+    """Serialized form of messages built by _history."""
+    return [
+        {
+            "role": "user" if isinstance(msg, HumanMessage) else "assistant",
+            "content": msg.content,
+            "name": None,
+        }
+        for msg in messages
+    ]
+
+
+class TestSerializeRunMessages:
+    """Tests for the per-run serialized message cache."""
+
+    def test_unchanged_history_is_cached(self, serialize_calls):
+        """Test that an unchanged history is returned without reconverting."""
+        messages = _history(3)
+
+        first = serialize_run_messages("run-1", messages)
+        second = serialize_run_messages("run-1", messages)
+
+        assert second is first
+        assert second == _expected(messages)
+        assert serialize_calls == [0]
+
+    def test_grown_history_serializes_tail_only(self, serialize_calls):
+        """Test that only messages appended since the cached tip are converted."""
+        messages = _history(5)
+        serialize_run_messages("run-1", messages[:3])
+
+        result = serialize_run_messages("run-1", messages)
+
+        assert result == _expected(messages)
+        assert serialize_calls == [0, 3]
+
+    def test_replaced_tip_rebuilds(self, serialize_calls):
+        """Test that a history whose last message changed is rebuilt in full."""
+        messages = _history(3)
+        serialize_run_messages("run-1", messages)
+
+        replaced = messages[:2] + [HumanMessage(content="edited", id="other")]
+        result = serialize_run_messages("run-1", replaced)
+
+        assert result == _expected(replaced)
+        assert serialize_calls == [0, 0]
+
+    def test_removed_tip_rebuilds(self, serialize_calls):
+        """Test that a shrunk history is rebuilt in full."""
+        messages = _history(3)
+        serialize_run_messages("run-1", messages)
+
+        result = serialize_run_messages("run-1", messages[:2])
+
+        assert result == _expected(messages[:2])
+        assert serialize_calls == [0, 0]
+
+    def test_grown_history_with_replaced_tip_rebuilds(self, serialize_calls):
+        """Test that growth on top of a different tip is not treated as a tail."""
+        messages = _history(3)
+        serialize_run_messages("run-1", messages)
+
+        rewritten = messages[:2] + [HumanMessage(content="edited", id="other")] + _history(5)[3:]
+        result = serialize_run_messages("run-1", rewritten)
+
+        assert result == _expected(rewritten)
+        assert serialize_calls == [0, 0]
+
+
+class TestSerializeMessages:
+    """Tests for serialize_messages limit and since."""
+
+    def test_limit_keeps_newest(self):
+        """Test that limit returns only the newest messages, oldest first."""
+        messages = _history(5)
+        assert serialize_messages(messages, limit=2) == _expected(messages[3:])
+
+    def test_limit_zero_and_larger_than_history(self):
+        """Test limit 0 returns nothing and a large limit returns everything."""
+        messages = _history(3)
+        assert serialize_messages(messages, limit=0) == []
+        assert serialize_messages(messages, limit=10) == _expected(messages)
+
+    def test_since_skips_seen_messages(self):
+        """Test that since skips messages the client already has."""
+        messages = _history(5)
+        assert serialize_messages(messages, since=3) == _expected(messages[3:])
+
+    def test_since_beyond_end(self):
+        """Test that a since at or past the end returns no messages."""
+        messages = _history(3)
+        assert serialize_messages(messages, since=3) == []
+        assert serialize_messages(messages, since=10) == []
+
+    def test_since_then_limit(self):
+        """Test that limit applies to the messages left after since."""
+        messages = _history(6)
+        assert serialize_messages(messages, limit=2, since=1) == _expected(messages[4:])